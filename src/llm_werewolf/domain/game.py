@@ -1,4 +1,6 @@
+from collections.abc import Iterable
 from dataclasses import dataclass, replace
+from functools import cached_property
 
 from llm_werewolf.domain.player import Player
 from llm_werewolf.domain.value_objects import Phase, Role, Team
@@ -18,35 +20,83 @@ class GameState:
     gm_summary: str | None = None
     gm_summary_log_offset: int = 0
 
-    @property
+    @cached_property
     def alive_players(self) -> tuple[Player, ...]:
         return tuple(p for p in self.players if p.is_alive)
 
-    @property
+    @cached_property
+    def players_by_name(self) -> dict[str, Player]:
+        """名前 → プレイヤーの対応表（名前が重複する場合は先頭のプレイヤーを優先）"""
+        return {p.name: p for p in reversed(self.players)}
+
+    @cached_property
+    def alive_by_role(self) -> dict[Role, tuple[Player, ...]]:
+        """役職 → 生存プレイヤーの対応表（生存者のいない役職はキーに含まない）"""
+        by_role: dict[Role, list[Player]] = {}
+        for p in self.alive_players:
+            by_role.setdefault(p.role, []).append(p)
+        return {role: tuple(players) for role, players in by_role.items()}
+
+    @cached_property
     def alive_werewolves(self) -> tuple[Player, ...]:
-        return tuple(p for p in self.alive_players if p.role == Role.WEREWOLF)
+        return self.alive_by_role.get(Role.WEREWOLF, ())
 
-    @property
+    @cached_property
     def alive_village_team(self) -> tuple[Player, ...]:
         """村人陣営の生存者"""
         return tuple(p for p in self.alive_players if p.role.team != Team.WEREWOLF)
 
     def find_player(self, name: str, *, alive_only: bool = False) -> "Player | None":
         """名前でプレイヤーを検索する。alive_only=True の場合は生存者のみ。"""
-        players = self.alive_players if alive_only else self.players
-        for p in players:
-            if p.name == name:
-                return p
-        return None
+        player = self.players_by_name.get(name)
+        if player is None or (alive_only and not player.is_alive):
+            return None
+        return player
 
     def replace_player(self, old: Player, new: Player) -> "GameState":
         """プレイヤーを差し替えた新しい GameState を返す"""
         players = tuple(new if p is old else p for p in self.players)
         return replace(self, players=players)
 
+    def apply_updates(
+        self,
+        *,
+        replaced_players: Iterable[tuple[Player, Player]] = (),
+        logs: Iterable[str] = (),
+        divined: Iterable[tuple[str, str]] = (),
+        medium_results: Iterable[tuple[int, str, bool]] = (),
+        phase: Phase | None = None,
+        day: int | None = None,
+    ) -> "GameState":
+        """複数の更新をまとめて適用した新しい GameState を返す（コピーは1回のみ）
+
+        replace_player / add_logs / add_divine_history / add_medium_result と
+        フェーズ・日付の変更を連続して行う場合に、中間の GameState 生成を省く。
+        """
+        replacements = {id(old): new for old, new in replaced_players}
+        new_logs = tuple(logs)
+        new_divined = tuple(divined)
+        new_medium_results = tuple(medium_results)
+        return replace(
+            self,
+            players=tuple(replacements.get(id(p), p) for p in self.players) if replacements else self.players,
+            log=self.log + new_logs,
+            divined_history=self.divined_history + new_divined,
+            medium_results=self.medium_results + new_medium_results,
+            phase=self.phase if phase is None else phase,
+            day=self.day if day is None else day,
+        )
+
     def add_log(self, message: str) -> "GameState":
         return replace(self, log=self.log + (message,))
 
+    def add_logs(self, messages: Iterable[str]) -> "GameState":
+        """複数のログをまとめて追加した新しい GameState を返す（コピーは1回のみ）"""
+        new_entries = tuple(messages)
+        if not new_entries:
+            return self
+        return replace(self, log=self.log + new_entries)
+
     def add_divine_history(self, seer_name: str, target_name: str) -> "GameState":
         """占い履歴を追加した新しい GameState を返す"""
         return replace(self, divined_history=self.divined_history + ((seer_name, target_name),))
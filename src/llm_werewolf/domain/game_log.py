@@ -6,17 +6,85 @@ Step 2 で LLM に渡すコンテキスト用に、プレイヤー視点でロ
 from __future__ import annotations
 
 from collections.abc import Sequence
+from enum import IntEnum
 
 from llm_werewolf.domain.game import GameState
 from llm_werewolf.domain.player import Player
 from llm_werewolf.domain.value_objects import Role
 
-_PRIVATE_PREFIXES = ("[配役]", "[占い結果]", "[占い]", "[護衛]", "[霊媒結果]", "[人狼仲間]", "[護衛成功]", "[思考]")
+
+class _LineKind(IntEnum):
+    """可視性判定用のログ種別。値はビットマスクのビット位置。"""
+
+    PUBLIC = 0
+    STATEMENT = 1
+    GUARD_SUCCESS = 2
+    ROLE = 3
+    DIVINE = 4
+    GUARD = 5
+    MEDIUM = 6
+    ALLIES = 7
+    THINKING = 8
+
+
+def _bits(*kinds: _LineKind) -> int:
+    mask = 0
+    for kind in kinds:
+        mask |= 1 << kind
+    return mask
+
+
+_TAG_KINDS: dict[str, _LineKind] = {
+    "[発言]": _LineKind.STATEMENT,
+    "[護衛成功]": _LineKind.GUARD_SUCCESS,
+    "[配役]": _LineKind.ROLE,
+    "[占い結果]": _LineKind.DIVINE,
+    "[占い]": _LineKind.DIVINE,
+    "[護衛]": _LineKind.GUARD,
+    "[霊媒結果]": _LineKind.MEDIUM,
+    "[人狼仲間]": _LineKind.ALLIES,
+    "[思考]": _LineKind.THINKING,
+}
+_MAX_TAG_LENGTH = max(len(tag) for tag in _TAG_KINDS)
+
+# GM-AI に渡す公開ログに含める種別
+_PUBLIC_MASK = _bits(_LineKind.PUBLIC, _LineKind.STATEMENT)
+
+_COMMON_MASK = _PUBLIC_MASK | _bits(_LineKind.GUARD_SUCCESS, _LineKind.ROLE, _LineKind.THINKING)
+
+# 役職ごとに閲覧できるログ種別（bit i が 1 なら種別 i を閲覧可能）
+_VISIBLE_MASK: dict[Role, int] = {
+    Role.VILLAGER: _COMMON_MASK,
+    Role.SEER: _COMMON_MASK | _bits(_LineKind.DIVINE),
+    Role.KNIGHT: _COMMON_MASK | _bits(_LineKind.GUARD),
+    Role.MEDIUM: _COMMON_MASK | _bits(_LineKind.MEDIUM),
+    Role.WEREWOLF: _COMMON_MASK | _bits(_LineKind.ALLIES),
+    Role.MADMAN: _COMMON_MASK,
+}
+
+# 役職条件に加えて、本人の名前を含むエントリのみ見える種別
+_OWNER_ONLY_MASK = _bits(_LineKind.ROLE, _LineKind.DIVINE, _LineKind.GUARD, _LineKind.MEDIUM)
+
+
+def _kind_of(log_entry: str) -> _LineKind:
+    """ログエントリ先頭の ``[...]`` タグから種別を判定する。未知のタグやタグなしは PUBLIC。
+
+    タグ候補ごとに ``startswith`` を繰り返す代わりに、先頭タグを 1 回だけ切り出して
+    辞書引きで分類する。``]`` の探索は既知タグの最大長までに限定し、長い行全体は走査しない。
+    """
+    if not log_entry.startswith("["):
+        return _LineKind.PUBLIC
+    end = log_entry.find("]", 1, _MAX_TAG_LENGTH)
+    if end < 0:
+        return _LineKind.PUBLIC
+    return _TAG_KINDS.get(log_entry[: end + 1], _LineKind.PUBLIC)
 
 
-def _is_visible(log_entry: str, player: Player) -> bool:
+def _is_visible(log_entry: str, kind: _LineKind, player: Player) -> bool:
     """ログエントリがプレイヤーに見えるかどうか判定する。
 
+    ``kind`` は ``_kind_of(log_entry)`` の結果。呼び出し側で 1 回だけ計算して渡す。
+
     フィルタリングルール:
     - [配役]: 自分の配役のみ見える
     - [占い結果]: 占い師本人のみ見える
@@ -27,27 +95,12 @@ def _is_visible(log_entry: str, player: Player) -> bool:
     - [思考]: 思考した本人のみ見える
     - その他: 全員に見える
     """
-    if log_entry.startswith("[配役]"):
+    if not (_VISIBLE_MASK.get(player.role, _COMMON_MASK) >> kind) & 1:
+        return False
+    if (_OWNER_ONLY_MASK >> kind) & 1:
         return player.name in log_entry
-
-    if log_entry.startswith("[占い結果]"):
-        return player.role == Role.SEER and player.name in log_entry
-
-    if log_entry.startswith("[占い]"):
-        return player.role == Role.SEER and player.name in log_entry
-
-    if log_entry.startswith("[護衛]"):
-        return player.role == Role.KNIGHT and player.name in log_entry
-
-    if log_entry.startswith("[霊媒結果]"):
-        return player.role == Role.MEDIUM and player.name in log_entry
-
-    if log_entry.startswith("[人狼仲間]"):
-        return player.role == Role.WEREWOLF
-
-    if log_entry.startswith("[思考]"):
+    if kind is _LineKind.THINKING:
         return log_entry.startswith(f"[思考] {player.name}:")
-
     return True
 
 
@@ -65,27 +118,33 @@ def filter_log_entries(entries: Sequence[str], player: Player, *, max_recent_sta
     Returns:
         フィルタリング済みのログ文字列（改行区切り）
     """
-    visible = [(i, entry) for i, entry in enumerate(entries) if _is_visible(entry, player)]
-
     if max_recent_statements < 0:
-        return "\n".join(entry for _, entry in visible)
+        return "\n".join(entry for entry in entries if _is_visible(entry, _kind_of(entry), player))
 
-    events: list[tuple[int, str]] = []
-    statements: list[tuple[int, str]] = []
-    for idx, entry in visible:
-        if entry.startswith(_STATEMENT_PREFIX):
-            statements.append((idx, entry))
-        else:
-            events.append((idx, entry))
+    kept: list[str] = []
+    statement_indices: list[int] = []
+    for entry in entries:
+        kind = _kind_of(entry)
+        if not _is_visible(entry, kind, player):
+            continue
+        if kind is _LineKind.STATEMENT:
+            statement_indices.append(len(kept))
+        kept.append(entry)
+    return _join_recent_statements(kept, statement_indices, max_recent_statements)
 
-    if len(statements) > max_recent_statements:
-        statements = statements[-max_recent_statements:] if max_recent_statements > 0 else []
 
-    merged = sorted(events + statements, key=lambda x: x[0])
-    return "\n".join(entry for _, entry in merged)
+def _join_recent_statements(entries: list[str], statement_indices: list[int], max_recent_statements: int) -> str:
+    """発言ログを直近 ``max_recent_statements`` 件に制限し、元の順序で連結する。
 
+    ``statement_indices`` は ``entries`` 内の発言ログの位置（昇順）。
+    イベントログは常に全件保持する。``max_recent_statements`` は 0 以上であること。
+    """
+    excess = len(statement_indices) - max_recent_statements
+    if excess <= 0:
+        return "\n".join(entries)
 
-_STATEMENT_PREFIX = "[発言]"
+    dropped = set(statement_indices[:excess])
+    return "\n".join(entry for i, entry in enumerate(entries) if i not in dropped)
 
 
 def format_log_for_context(game: GameState, player_name: str, *, max_recent_statements: int = 30) -> str:
@@ -109,24 +168,7 @@ def format_log_for_context(game: GameState, player_name: str, *, max_recent_stat
     if player is None:
         raise ValueError(f"Player '{player_name}' not found in game")
 
-    visible = [(i, entry) for i, entry in enumerate(game.log) if _is_visible(entry, player)]
-
-    if max_recent_statements < 0:
-        return "\n".join(entry for _, entry in visible)
-
-    events: list[tuple[int, str]] = []
-    statements: list[tuple[int, str]] = []
-    for idx, entry in visible:
-        if entry.startswith(_STATEMENT_PREFIX):
-            statements.append((idx, entry))
-        else:
-            events.append((idx, entry))
-
-    if len(statements) > max_recent_statements:
-        statements = statements[-max_recent_statements:] if max_recent_statements > 0 else []
-
-    merged = sorted(events + statements, key=lambda x: x[0])
-    return "\n".join(entry for _, entry in merged)
+    return filter_log_entries(game.log, player, max_recent_statements=max_recent_statements)
 
 
 def format_public_log(game: GameState, *, max_recent_statements: int = -1) -> str:
@@ -142,20 +184,16 @@ def format_public_log(game: GameState, *, max_recent_statements: int = -1) -> st
     Returns:
         公開ログ文字列（改行区切り）
     """
-    public = [entry for entry in game.log if not any(entry.startswith(p) for p in _PRIVATE_PREFIXES)]
     if max_recent_statements < 0:
-        return "\n".join(public)
-
-    events: list[tuple[int, str]] = []
-    statements: list[tuple[int, str]] = []
-    for i, entry in enumerate(public):
-        if entry.startswith(_STATEMENT_PREFIX):
-            statements.append((i, entry))
-        else:
-            events.append((i, entry))
-
-    if len(statements) > max_recent_statements:
-        statements = statements[-max_recent_statements:] if max_recent_statements > 0 else []
-
-    merged = sorted(events + statements, key=lambda x: x[0])
-    return "\n".join(entry for _, entry in merged)
+        return "\n".join(entry for entry in game.log if (_PUBLIC_MASK >> _kind_of(entry)) & 1)
+
+    public: list[str] = []
+    statement_indices: list[int] = []
+    for entry in game.log:
+        kind = _kind_of(entry)
+        if not (_PUBLIC_MASK >> kind) & 1:
+            continue
+        if kind is _LineKind.STATEMENT:
+            statement_indices.append(len(public))
+        public.append(entry)
+    return _join_recent_statements(public, statement_indices, max_recent_statements)
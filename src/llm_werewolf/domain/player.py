@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 from llm_werewolf.domain.value_objects import PlayerStatus, Role
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Player:
     """プレイヤーエンティティ"""
 
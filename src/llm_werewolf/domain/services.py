@@ -122,6 +122,8 @@ def check_victory(game: GameState) -> Team | None:
     Returns:
         勝利した陣営（Team）。未決着なら None
     """
+    # alive_players / alive_werewolves は GameState ごとにキャッシュされるため、
+    # 同じ状態に対する2回目以降の判定は件数の比較だけで済む
     alive_werewolf_count = len(game.alive_werewolves)
     alive_non_werewolf_count = len(game.alive_players) - alive_werewolf_count
 
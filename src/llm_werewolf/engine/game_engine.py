@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import random
-from collections import Counter
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import replace
@@ -16,11 +15,14 @@ from llm_werewolf.engine.action_provider import ActionProvider
 if TYPE_CHECKING:
     from llm_werewolf.engine.game_master import GameMasterProvider
 from llm_werewolf.engine.game_logic import (
+    count_votes_for,
     execute_attack,
     execute_divine,
     execute_guard,
     execute_initial_divine,
     find_night_actor,
+    format_divine_result,
+    format_game_over,
     get_alive_speaking_order,
     get_discussion_rounds,
     get_night_action_candidates,
@@ -53,6 +55,8 @@ class GameEngine:
         # 発言順をランダムに決定
         names = [p.name for p in game.players]
         self._speaking_order: tuple[str, ...] = tuple(self._rng.sample(names, len(names)))
+        # 夜の占い解決時に確定した翌朝の占い結果通知
+        self._pending_divine_log: str | None = None
 
     @property
     def game(self) -> GameState:
@@ -84,21 +88,18 @@ class GameEngine:
                 return self._game
 
     def _log_role_assignment(self) -> GameState:
-        game = self._game
-        for player in game.players:
-            game = game.add_log(f"[配役] {player.name}: {player.role.value}")
-        return game
+        return self._game.add_logs(f"[配役] {player.name}: {player.role.value}" for player in self._game.players)
 
     def _log_winner(self, winner: Team) -> GameState:
-        label = "村人陣営" if winner == Team.VILLAGE else "人狼陣営"
-        return self._game.add_log(f"=== ゲーム終了: {label}の勝利 ===")
+        return self._game.add_log(format_game_over(winner))
 
     def _day_phase(self) -> GameState:
         game = self._game
         game = game.add_log(f"--- Day {game.day} （昼フェーズ） ---")
 
         # 占い結果通知 (Day 2以降)
-        game = notify_divine_result(game)
+        game = notify_divine_result(game, self._pending_divine_log)
+        self._pending_divine_log = None
 
         # 霊媒結果通知 (Day 2以降)
         game = notify_medium_result(game)
@@ -136,19 +137,23 @@ class GameEngine:
         game, guard_target_name = self._apply_night_guard(game, guard_decision)
         game, attack_target_name = self._apply_night_attack(game, attack_decision)
 
+        # 襲撃・占い記録・日付更新の結果を集め、最後に GameState へ一括で反映する
+        night_logs: list[str] = []
+        killed: list[tuple[Player, Player]] = []
+        divined: list[tuple[str, str]] = []
+
         # 襲撃処理（護衛判定を含む）
         attacked_name: str | None = None
         if attack_target_name is not None:
             if guard_target_name is not None and guard_target_name == attack_target_name:
                 # 護衛成功（GJ）
-                game = game.add_log(f"[護衛成功] {attack_target_name} への襲撃は護衛により阻止された")
-                game = game.add_log("[襲撃] 今夜は誰も襲撃されなかった")
+                night_logs.append(f"[護衛成功] {attack_target_name} への襲撃は護衛により阻止された")
+                night_logs.append("[襲撃] 今夜は誰も襲撃されなかった")
             else:
                 target = game.find_player(attack_target_name, alive_only=True)
                 if target is not None:
-                    dead_player = target.killed()
-                    game = game.replace_player(target, dead_player)
-                    game = game.add_log(f"[襲撃] {target.name} が人狼に襲撃された")
+                    killed.append((target, target.killed()))
+                    night_logs.append(f"[襲撃] {target.name} が人狼に襲撃された")
                     attacked_name = target.name
 
                     # 占い師が襲撃された場合、占い結果は無効
@@ -159,46 +164,53 @@ class GameEngine:
 
         # 占い結果を記録（占い師が生存している場合のみ）
         if divine_result is not None:
-            seer_name, target_name, _ = divine_result
-            game = game.add_divine_history(seer_name, target_name)
+            seer_name, target_name, is_werewolf = divine_result
+            divined.append((seer_name, target_name))
+            self._pending_divine_log = format_divine_result(seer_name, target_name, is_werewolf)
 
         # 襲撃された人の次から発言順を回転
         if attacked_name is not None:
             self._speaking_order = rotate_speaking_order(self._speaking_order, attacked_name)
 
         # 次の日へ
-        game = replace(game, phase=Phase.DAY, day=game.day + 1)
+        game = game.apply_updates(
+            replaced_players=killed, logs=night_logs, divined=divined, phase=Phase.DAY, day=game.day + 1
+        )
         return game
 
     def _discussion_phase(self, game: GameState) -> GameState:
         rounds = get_discussion_rounds(game.day)
         ordered = get_alive_speaking_order(game, self._speaking_order)
         order_names = tuple(p.name for p in ordered)
+        # プロバイダはゲーム中に変化しないため、発言順に揃えたリストを一度だけ解決する
+        ordered_providers = [self._providers[p.name] for p in ordered]
         for round_num in range(1, rounds + 1):
             game = game.add_log(f"[議論] ラウンド {round_num}")
             for i, player in enumerate(ordered):
-                provider = self._providers[player.name]
+                provider = ordered_providers[i]
                 provider.set_speaking_context(order_names, i)
                 result = provider.discuss(game, player)
-                if result.thinking:
-                    game = game.add_log(f"[思考] {player.name}: {result.thinking}")
-                game = game.add_log(f"[発言] {player.name}: {result.message}")
+                # 後続の話者が参照できるよう、発言ごとに（思考と発言をまとめて）記録する
+                speech_logs = [f"[思考] {player.name}: {result.thinking}"] if result.thinking else []
+                speech_logs.append(f"[発言] {player.name}: {result.message}")
+                game = game.add_logs(speech_logs)
         return game
 
     def _vote_and_execution_phase(self, game: GameState) -> GameState:
         votes: dict[str, str] = {}
         vote_thinking: dict[str, str] = {}
 
-        voters = [(player, self._providers[player.name]) for player in game.alive_players]
+        # 生存者タプルを一度だけ生成し、各投票者の候補は自分の位置を除いたスライスで作る
+        alive = game.alive_players
+        voters = [(player, self._providers[player.name], alive[:i] + alive[i + 1 :]) for i, player in enumerate(alive)]
 
-        def vote_task(player: Player, provider: ActionProvider) -> tuple[str, str, str]:
-            candidates = tuple(p for p in game.alive_players if p.name != player.name)
+        def vote_task(player: Player, provider: ActionProvider, candidates: tuple[Player, ...]) -> tuple[str, str, str]:
             target_name = provider.vote(game, player, candidates)
             thinking = getattr(provider, "last_thinking", "")
             return player.name, target_name, thinking
 
         with ThreadPoolExecutor(max_workers=len(voters)) as executor:
-            futures = {executor.submit(vote_task, p, prov): p.name for p, prov in voters}
+            futures = {executor.submit(vote_task, p, prov, cands): p.name for p, prov, cands in voters}
             for future in as_completed(futures):
                 name, target_name, thinking = future.result()
                 votes[name] = target_name
@@ -206,10 +218,12 @@ class GameEngine:
                     vote_thinking[name] = thinking
 
         # 全投票収集後にまとめてログ記録（投票中に他者の投票が見えないようにする）
+        vote_logs: list[str] = []
         for voter_name, vote_target in votes.items():
             if voter_name in vote_thinking:
-                game = game.add_log(f"[思考] {voter_name}: {vote_thinking[voter_name]}")
-            game = game.add_log(f"[投票] {voter_name} → {vote_target}")
+                vote_logs.append(f"[思考] {voter_name}: {vote_thinking[voter_name]}")
+            vote_logs.append(f"[投票] {voter_name} → {vote_target}")
+        game = game.add_logs(vote_logs)
 
         # 集計
         executed_name = tally_votes(votes, self._rng)
@@ -218,13 +232,13 @@ class GameEngine:
         if executed_name is not None:
             target = game.find_player(executed_name, alive_only=True)
             if target is not None:
-                vote_counts = Counter(votes.values())
                 is_werewolf = target.role == Role.WEREWOLF
-                dead_player = target.killed()
-                game = game.replace_player(target, dead_player)
-                game = game.add_log(f"[処刑] {target.name} が処刑された（得票数: {vote_counts[executed_name]}）")
-                # 霊媒結果を記録
-                game = game.add_medium_result(game.day, target.name, is_werewolf)
+                # 処刑・ログ・霊媒結果の記録を一括で反映する
+                game = game.apply_updates(
+                    replaced_players=[(target, target.killed())],
+                    logs=[f"[処刑] {target.name} が処刑された（得票数: {count_votes_for(votes, executed_name)}）"],
+                    medium_results=[(game.day, target.name, is_werewolf)],
+                )
 
         return game
 
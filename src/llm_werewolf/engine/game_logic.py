@@ -7,26 +7,35 @@ GameEngine（一括実行）と InteractiveGameEngine（ステップ実行）が
 from __future__ import annotations
 
 import random
-from collections import Counter
 
 from llm_werewolf.domain.game import GameState
 from llm_werewolf.domain.player import Player
 from llm_werewolf.domain.services import can_attack, can_divine, can_guard
-from llm_werewolf.domain.value_objects import NightActionType, Role
+from llm_werewolf.domain.value_objects import NightActionType, Role, Team
+
+# 勝利陣営 → ゲーム終了ログに載せる陣営名
+_WINNER_LABEL: dict[Team, str] = {Team.VILLAGE: "村人陣営", Team.WEREWOLF: "人狼陣営"}
 
 
 def get_alive_speaking_order(game: GameState, speaking_order: tuple[str, ...]) -> list[Player]:
     """speaking_order に基づき生存プレイヤーを発言順で返す。"""
     if not speaking_order:
         return list(game.alive_players)
-    alive_names = {p.name for p in game.alive_players}
-    name_to_player = {p.name: p for p in game.alive_players}
-    return [name_to_player[name] for name in speaking_order if name in alive_names]
+    players_by_name = game.players_by_name
+    if len(game.alive_players) == len(game.players):
+        # 死亡者がいなければ生存判定は不要
+        return [players_by_name[name] for name in speaking_order if name in players_by_name]
+    ordered: list[Player] = []
+    for name in speaking_order:
+        player = players_by_name.get(name)
+        if player is not None and player.is_alive:
+            ordered.append(player)
+    return ordered
 
 
 def execute_initial_divine(game: GameState, rng: random.Random) -> GameState:
     """初日占い: ゲーム開始時に占い師が人狼以外の1人をランダムに占う。"""
-    seer_players = [p for p in game.alive_players if p.role == Role.SEER]
+    seer_players = game.alive_by_role.get(Role.SEER)
     if not seer_players:
         return game
     seer = seer_players[0]
@@ -41,13 +50,36 @@ def execute_initial_divine(game: GameState, rng: random.Random) -> GameState:
     return game
 
 
-def notify_divine_result(game: GameState) -> GameState:
-    """占い結果を通知する。"""
-    seer_players = [p for p in game.alive_players if p.role == Role.SEER]
-    if not seer_players:
+def format_game_over(winner: Team) -> str:
+    """ゲーム終了ログの文字列を返す。"""
+    return f"=== ゲーム終了: {_WINNER_LABEL[winner]}の勝利 ==="
+
+
+def format_divine_result(seer_name: str, target_name: str, is_werewolf: bool) -> str:
+    """占い結果通知のログ文字列を返す。"""
+    result_text = "人狼" if is_werewolf else "人狼ではない"
+    return f"[占い結果] {seer_name} の占い: {target_name} は {result_text}"
+
+
+def notify_divine_result(game: GameState, pending_log: str | None = None) -> GameState:
+    """占い結果を通知する。
+
+    ``pending_log`` には前夜の占い解決時に :func:`format_divine_result` で確定済みの
+    通知文を渡せる。指定時は占い師・履歴・対象の再検索を行わずにそのまま記録する。
+    未指定時（初日占いや外部で構築した GameState）は占い履歴から結果を導出する。
+    """
+    if pending_log is not None:
+        return game.add_log(pending_log)
+
+    # Day 1 も初日占いの結果を通知するため、日付での早期リターンはしない
+    if not game.divined_history:
         return game
 
+    seer_players = game.alive_by_role.get(Role.SEER)
+    if not seer_players:
+        return game
     seer = seer_players[0]
+
     history = game.get_divined_history(seer.name)
     if not history:
         return game
@@ -55,9 +87,7 @@ def notify_divine_result(game: GameState) -> GameState:
     last_target_name = history[-1]
     last_target = game.find_player(last_target_name)
     if last_target is not None:
-        is_werewolf = last_target.role == Role.WEREWOLF
-        result_text = "人狼" if is_werewolf else "人狼ではない"
-        game = game.add_log(f"[占い結果] {seer.name} の占い: {last_target_name} は {result_text}")
+        game = game.add_log(format_divine_result(seer.name, last_target_name, last_target.role == Role.WEREWOLF))
 
     return game
 
@@ -129,27 +159,36 @@ def tally_votes(votes: dict[str, str], rng: random.Random) -> str | None:
     if not votes:
         return None
 
-    vote_counts = Counter(votes.values())
-    max_votes = max(vote_counts.values())
+    # 得票数と最多得票数を1パスで求める（候補の並びは初出順のまま保ち、同票時の抽選結果を変えない）
+    vote_counts: dict[str, int] = {}
+    max_votes = 0
+    for name in votes.values():
+        count = vote_counts[name] = vote_counts.get(name, 0) + 1
+        if count > max_votes:
+            max_votes = count
     top_candidates = [name for name, count in vote_counts.items() if count == max_votes]
     return rng.choice(top_candidates) if len(top_candidates) > 1 else top_candidates[0]
 
 
+def count_votes_for(votes: dict[str, str], target_name: str) -> int:
+    """指定プレイヤーの得票数を返す。"""
+    return sum(1 for target in votes.values() if target == target_name)
+
+
 def rotate_speaking_order(speaking_order: tuple[str, ...], removed_name: str) -> tuple[str, ...]:
     """襲撃された人の次から発言順を回転させる（襲撃された人は除外）。"""
-    order = list(speaking_order)
-    if removed_name not in order:
+    try:
+        idx = speaking_order.index(removed_name)
+    except ValueError:
         return speaking_order
-    idx = order.index(removed_name)
-    rotated = order[idx + 1 :] + order[:idx]
-    return tuple(rotated)
+    return speaking_order[idx + 1 :] + speaking_order[:idx]
 
 
 def find_night_actor(game: GameState, night_action_type: NightActionType) -> Player | None:
     """指定された夜行動種別を持つ生存プレイヤーを返す。"""
-    for p in game.alive_players:
-        if p.role.night_action_type == night_action_type:
-            return p
+    for role, players in game.alive_by_role.items():
+        if role.night_action_type == night_action_type:
+            return players[0]
     return None
 
 
@@ -170,7 +209,7 @@ def notify_medium_result(game: GameState) -> GameState:
     if game.day < 2:
         return game
 
-    medium_players = [p for p in game.alive_players if p.role == Role.MEDIUM]
+    medium_players = game.alive_by_role.get(Role.MEDIUM)
     if not medium_players:
         return game
 
@@ -7,7 +7,6 @@ session.py はこのエンジンを呼び出す薄いラッパーとして機能
 from __future__ import annotations
 
 import random
-from collections import Counter
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import replace
@@ -19,10 +18,12 @@ from llm_werewolf.domain.services import check_victory
 from llm_werewolf.domain.value_objects import NightActionType, Phase, Role, Team
 from llm_werewolf.engine.action_provider import ActionProvider
 from llm_werewolf.engine.game_logic import (
+    count_votes_for,
     execute_attack,
     execute_divine,
     execute_guard,
     find_night_actor,
+    format_divine_result,
     get_alive_speaking_order,
     get_discussion_rounds,
     get_night_action_candidates,
@@ -63,6 +64,9 @@ class InteractiveGameEngine:
         on_progress: ProgressCallback | None = None,
         on_message: MessageCallback | None = None,
         on_token_chunk: TokenChunkCallback | None = None,
+        pending_divine_log: str | None = None,
+        discussion_order: tuple[str, ...] = (),
+        human_order_index: int | None = None,
     ) -> None:
         self._game = game
         self._providers = providers
@@ -74,6 +78,10 @@ class InteractiveGameEngine:
         self._on_progress = on_progress
         self._on_message = on_message
         self._on_token_chunk = on_token_chunk
+        self._pending_divine_log = pending_divine_log
+        # 現ラウンドの発言順とその中のユーザー位置（advance_discussion で確定し handle_user_discuss で再利用）
+        self._discussion_order = discussion_order
+        self._human_order_index = human_order_index
 
     @property
     def game(self) -> GameState:
@@ -87,6 +95,21 @@ class InteractiveGameEngine:
     def discussion_round(self) -> int:
         return self._discussion_round
 
+    @property
+    def pending_divine_log(self) -> str | None:
+        """前夜に確定した、次の昼に通知する占い結果ログ。"""
+        return self._pending_divine_log
+
+    @property
+    def discussion_order(self) -> tuple[str, ...]:
+        """現ラウンドの生存者の発言順（ユーザー発言待ちの間のみ保持）。"""
+        return self._discussion_order
+
+    @property
+    def human_order_index(self) -> int | None:
+        """discussion_order 内のユーザーの位置。"""
+        return self._human_order_index
+
     def advance_discussion(self) -> list[str]:
         """1ラウンド分の AI 議論（ユーザーの手番まで）を実行する。
 
@@ -100,7 +123,8 @@ class InteractiveGameEngine:
         if self._discussion_round == 0:
             self._game = self._game.add_log(f"--- Day {self._game.day} （昼フェーズ） ---")
             self._game = replace(self._game, phase=Phase.DAY)
-            self._game = notify_divine_result(self._game)
+            self._game = notify_divine_result(self._game, self._pending_divine_log)
+            self._pending_divine_log = None
             self._game = notify_medium_result(self._game)
 
             # GM-AI 要約 (Day 2以降)
@@ -117,11 +141,13 @@ class InteractiveGameEngine:
         order_names = tuple(p.name for p in ordered)
 
         if human is None:
-            ai_players = [p for p in ordered if p.name in self._providers]
+            ai_players = self._bind_providers(ordered)
             messages = self._run_ai_discussion(ai_players, order_names=order_names)
         else:
-            human_idx = next(i for i, p in enumerate(ordered) if p.name == self._human_player_name)
-            before = [p for p in ordered[:human_idx] if p.name in self._providers]
+            human_idx = order_names.index(self._human_player_name)
+            self._discussion_order = order_names
+            self._human_order_index = human_idx
+            before = self._bind_providers(ordered[:human_idx])
             messages = self._run_ai_discussion(before, order_names=order_names)
 
         return messages
@@ -143,10 +169,16 @@ class InteractiveGameEngine:
             self._game = self._game.add_log(f"[発言] {human.name}: {message}")
             messages.append(f"{human.name}: {message}")
 
-            ordered = get_alive_speaking_order(self._game, self._speaking_order)
-            order_names = tuple(p.name for p in ordered)
-            human_idx = next(i for i, p in enumerate(ordered) if p.name == self._human_player_name)
-            after = [p for p in ordered[human_idx + 1 :] if p.name in self._providers]
+            order_names = self._discussion_order
+            human_idx = self._human_order_index
+            if not order_names or human_idx is None:
+                order_names = tuple(p.name for p in get_alive_speaking_order(self._game, self._speaking_order))
+                human_idx = order_names.index(self._human_player_name)
+            self._discussion_order = ()
+            self._human_order_index = None
+            # 議論中は死亡者が出ないため、確定済みの発言順をそのまま使える
+            players_by_name = self._game.players_by_name
+            after = self._bind_providers([players_by_name[name] for name in order_names[human_idx + 1 :]])
             after_msgs = self._run_ai_discussion(after, order_names=order_names)
             messages.extend(after_msgs)
 
@@ -199,9 +231,18 @@ class InteractiveGameEngine:
         self._game = self._game.add_log(f"--- Night {self._game.day} （夜フェーズ） ---")
         self._game = replace(self._game, phase=Phase.NIGHT)
 
-        if self._human_has_night_action() and self.get_night_action_candidates():
-            return True
-        return False
+        _, candidates = self.get_night_action()
+        return bool(candidates)
+
+    def get_night_action(self) -> tuple[NightActionType | None, list[Player]]:
+        """ユーザーの夜行動タイプと対象候補をまとめて返す（プレイヤー検索は1回のみ）。"""
+        human = self._game.find_player(self._human_player_name, alive_only=True)
+        if human is None:
+            return None, []
+        action_type = human.role.night_action_type
+        if action_type is None:
+            return None, []
+        return action_type, list(get_night_action_candidates(self._game, human))
 
     def get_night_action_type(self) -> NightActionType | None:
         """ユーザーの夜行動タイプを返す。"""
@@ -212,10 +253,8 @@ class InteractiveGameEngine:
 
     def get_night_action_candidates(self) -> list[Player]:
         """ユーザーの夜行動の対象候補を返す。"""
-        human = self._game.find_player(self._human_player_name, alive_only=True)
-        if human is None:
-            return []
-        return list(get_night_action_candidates(self._game, human))
+        _, candidates = self.get_night_action()
+        return candidates
 
     def resolve_night(
         self,
@@ -245,20 +284,24 @@ class InteractiveGameEngine:
         guard_target_name = self._apply_night_guard(guard_decision)
         attack_target_name = self._apply_night_attack(attack_decision)
 
+        # 襲撃・占い記録・日付更新の結果を集め、最後に GameState へ一括で反映する
+        night_logs: list[str] = []
+        killed: list[tuple[Player, Player]] = []
+        divined: list[tuple[str, str]] = []
+
         # 襲撃処理（護衛判定を含む）
         attacked_name: str | None = None
         if attack_target_name is not None:
             if guard_target_name is not None and guard_target_name == attack_target_name:
                 # 護衛成功（GJ）
-                self._game = self._game.add_log(f"[護衛成功] {attack_target_name} への襲撃は護衛により阻止された")
-                self._game = self._game.add_log("[襲撃] 今夜は誰も襲撃されなかった")
+                night_logs.append(f"[護衛成功] {attack_target_name} への襲撃は護衛により阻止された")
+                night_logs.append("[襲撃] 今夜は誰も襲撃されなかった")
                 night_messages.append("今夜は誰も襲撃されなかった")
             else:
                 attack_target = self._game.find_player(attack_target_name, alive_only=True)
                 if attack_target is not None:
-                    dead_player = attack_target.killed()
-                    self._game = self._game.replace_player(attack_target, dead_player)
-                    self._game = self._game.add_log(f"[襲撃] {attack_target.name} が人狼に襲撃された")
+                    killed.append((attack_target, attack_target.killed()))
+                    night_logs.append(f"[襲撃] {attack_target.name} が人狼に襲撃された")
                     night_messages.append(f"{attack_target.name} が人狼に襲撃された")
                     attacked_name = attack_target.name
 
@@ -268,15 +311,20 @@ class InteractiveGameEngine:
 
         # 占い結果を記録
         if divine_result is not None:
-            seer_name, target_name_rec, _ = divine_result
-            self._game = self._game.add_divine_history(seer_name, target_name_rec)
+            seer_name, target_name_rec, is_werewolf = divine_result
+            divined.append((seer_name, target_name_rec))
+            self._pending_divine_log = format_divine_result(seer_name, target_name_rec, is_werewolf)
 
-        # 発言順を回転
+        # 発言順を回転（前日のラウンドで確定した発言順の記録も破棄する）
         if attacked_name is not None:
             self._speaking_order = rotate_speaking_order(self._speaking_order, attacked_name)
+        self._discussion_order = ()
+        self._human_order_index = None
 
         # 次の日へ
-        self._game = replace(self._game, phase=Phase.DAY, day=self._game.day + 1)
+        self._game = self._game.apply_updates(
+            replaced_players=killed, logs=night_logs, divined=divined, phase=Phase.DAY, day=self._game.day + 1
+        )
 
         winner = check_victory(self._game)
         return night_messages, winner
@@ -293,15 +341,25 @@ class InteractiveGameEngine:
         if self._on_message is not None:
             self._on_message(player_name, text)
 
-    def _run_ai_discussion(self, players: list[Player], *, order_names: tuple[str, ...] = ()) -> list[str]:
+    def _bind_providers(self, players: list[Player]) -> list[tuple[Player, ActionProvider]]:
+        """プロバイダを持つ（AI）プレイヤーのみを (player, provider) の組で返す。"""
+        bound: list[tuple[Player, ActionProvider]] = []
+        for player in players:
+            provider = self._providers.get(player.name)
+            if provider is not None:
+                bound.append((player, provider))
+        return bound
+
+    def _run_ai_discussion(
+        self, players: list[tuple[Player, ActionProvider]], *, order_names: tuple[str, ...] = ()
+    ) -> list[str]:
         """指定 AI プレイヤーの発言を実行し、発言メッセージリストを返す。"""
         messages: list[str] = []
-        for player in players:
+        position = {name: i for i, name in enumerate(order_names)}
+        for player, provider in players:
             self._notify_progress(player.name, "discuss")
-            provider = self._providers[player.name]
             if order_names:
-                idx = order_names.index(player.name)
-                provider.set_speaking_context(order_names, idx)
+                provider.set_speaking_context(order_names, position[player.name])
 
             # ストリーミングコールバック設定
             if self._on_token_chunk is not None and hasattr(provider, "set_token_callback"):
@@ -320,47 +378,52 @@ class InteractiveGameEngine:
             if hasattr(provider, "set_token_callback"):
                 provider.set_token_callback(None)
 
-            if result.thinking:
-                self._game = self._game.add_log(f"[思考] {player.name}: {result.thinking}")
-            self._game = self._game.add_log(f"[発言] {player.name}: {result.message}")
+            # 後続の話者が参照できるよう、発言ごとに（思考と発言をまとめて）記録する
+            speech_logs = [f"[思考] {player.name}: {result.thinking}"] if result.thinking else []
+            speech_logs.append(f"[発言] {player.name}: {result.message}")
+            self._game = self._game.add_logs(speech_logs)
             messages.append(f"{player.name}: {result.message}")
             self._notify_message(player.name, result.message)
         return messages
 
     def _collect_ai_votes(self, votes: dict[str, str]) -> None:
         """AI プレイヤーの投票を並行収集する（ログ記録は行わない）。"""
-        ai_voters = [
-            (player, self._providers[player.name])
-            for player in self._game.alive_players
-            if player.name != self._human_player_name and player.name in self._providers
-        ]
+        # 生存者タプルを一度だけ生成し、各投票者の候補は自分の位置を除いたスライスで作る
+        alive = self._game.alive_players
+        ai_voters: list[tuple[Player, ActionProvider, tuple[Player, ...]]] = []
+        for i, player in enumerate(alive):
+            if player.name == self._human_player_name:
+                continue
+            provider = self._providers.get(player.name)
+            if provider is not None:
+                ai_voters.append((player, provider, alive[:i] + alive[i + 1 :]))
         if not ai_voters:
             return
 
         # 全AIに先行して progress 通知
-        for player, _ in ai_voters:
+        for player, _, _ in ai_voters:
             self._notify_progress(player.name, "vote")
 
         game_snapshot = self._game
 
-        def vote_task(player: Player, provider: ActionProvider) -> tuple[str, str, str]:
-            candidates = tuple(p for p in game_snapshot.alive_players if p.name != player.name)
+        def vote_task(player: Player, provider: ActionProvider, candidates: tuple[Player, ...]) -> tuple[str, str, str]:
             target = provider.vote(game_snapshot, player, candidates)
             thinking = getattr(provider, "last_thinking", "")
             return player.name, target, thinking
 
+        thinking_logs: list[str] = []
         with ThreadPoolExecutor(max_workers=len(ai_voters)) as executor:
-            futures = {executor.submit(vote_task, p, prov): p.name for p, prov in ai_voters}
+            futures = {executor.submit(vote_task, p, prov, cands): p.name for p, prov, cands in ai_voters}
             for future in as_completed(futures):
                 name, target, thinking = future.result()
                 if thinking:
-                    self._game = self._game.add_log(f"[思考] {name}: {thinking}")
+                    thinking_logs.append(f"[思考] {name}: {thinking}")
                 votes[name] = target
+        self._game = self._game.add_logs(thinking_logs)
 
     def _log_votes(self, votes: dict[str, str]) -> None:
         """全投票をまとめてログに記録する。"""
-        for voter, target in votes.items():
-            self._game = self._game.add_log(f"[投票] {voter} → {target}")
+        self._game = self._game.add_logs(f"[投票] {voter} → {target}" for voter, target in votes.items())
 
     def _execute_votes(self, votes: dict[str, str]) -> Team | None:
         """投票を集計・処刑し、勝利判定を行う。"""
@@ -368,28 +431,18 @@ class InteractiveGameEngine:
         if executed_name is None:
             return None
 
-        vote_counts = Counter(votes.values())
-
         executed_player = self._game.find_player(executed_name, alive_only=True)
         if executed_player is not None:
             is_werewolf = executed_player.role == Role.WEREWOLF
-            dead_player = executed_player.killed()
-            self._game = self._game.replace_player(executed_player, dead_player)
-            self._game = self._game.add_log(
-                f"[処刑] {executed_player.name} が処刑された（得票数: {vote_counts[executed_name]}）"
+            # 処刑・ログ・霊媒結果の記録を一括で反映する
+            self._game = self._game.apply_updates(
+                replaced_players=[(executed_player, executed_player.killed())],
+                logs=[f"[処刑] {executed_player.name} が処刑された（得票数: {count_votes_for(votes, executed_name)}）"],
+                medium_results=[(self._game.day, executed_player.name, is_werewolf)],
             )
-            # 霊媒結果を記録
-            self._game = self._game.add_medium_result(self._game.day, executed_player.name, is_werewolf)
 
         return check_victory(self._game)
 
-    def _human_has_night_action(self) -> bool:
-        """ユーザーが夜行動を持つか判定する。"""
-        human = self._game.find_player(self._human_player_name, alive_only=True)
-        if human is None:
-            return False
-        return human.role.has_night_action
-
     def _collect_night_decision(
         self, action_type: NightActionType, human_target: str | None
     ) -> tuple[Player, str, str] | None:
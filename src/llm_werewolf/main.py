@@ -27,8 +27,8 @@ from llm_werewolf.session import (
     SessionLimitExceeded,
     advance_from_execution_result,
     advance_to_discussion,
+    get_night_action,
     get_night_action_candidates,
-    get_night_action_type,
     handle_auto_vote,
     handle_night_action,
     handle_user_discuss,
@@ -578,8 +578,9 @@ async def play_game(request: Request, game_id: str, debug: str = "") -> HTMLResp
     )
 
     # 夜行動のコンテキスト（display_order 順）
-    night_action_type = get_night_action_type(session) if session.step == GameStep.NIGHT_ACTION else None
-    night_action_candidates_raw = get_night_action_candidates(session) if session.step == GameStep.NIGHT_ACTION else []
+    night_action_type, night_action_candidates_raw = (
+        get_night_action(session) if session.step is GameStep.NIGHT_ACTION else (None, [])
+    )
     night_action_candidates = sorted(night_action_candidates_raw, key=lambda p: display_index.get(p.name, 999))
 
     # display_order に基づくプレイヤー表示順（ゲーム中固定）
@@ -645,19 +646,19 @@ async def advance_game(game_id: str) -> RedirectResponse:
     human_is_alive = human_player is not None and human_player.is_alive
 
     advanced = False
-    if session.step == GameStep.ROLE_REVEAL:
+    if session.step is GameStep.ROLE_REVEAL:
         advance_to_discussion(session)
         advanced = True
-    elif session.step == GameStep.DISCUSSION and not human_is_alive:
+    elif session.step is GameStep.DISCUSSION and not human_is_alive:
         skip_to_vote(session)
         advanced = True
-    elif session.step == GameStep.VOTE and not human_is_alive:
+    elif session.step is GameStep.VOTE and not human_is_alive:
         handle_auto_vote(session)
         advanced = True
-    elif session.step == GameStep.EXECUTION_RESULT:
+    elif session.step is GameStep.EXECUTION_RESULT:
         advance_from_execution_result(session)
         advanced = True
-    elif session.step == GameStep.NIGHT_RESULT:
+    elif session.step is GameStep.NIGHT_RESULT:
         advance_to_discussion(session)
         advanced = True
 
@@ -675,7 +676,7 @@ async def submit_discussion(game_id: str, message: str = Form("")) -> RedirectRe
     if session is None:
         raise HTTPException(status_code=404, detail="Game not found")
 
-    if session.step != GameStep.DISCUSSION:
+    if session.step is not GameStep.DISCUSSION:
         raise HTTPException(status_code=400, detail="Invalid step")
 
     text = message.strip() or "..."
@@ -693,13 +694,12 @@ async def submit_night_action(game_id: str, target: str = Form(...)) -> Redirect
     if session is None:
         raise HTTPException(status_code=404, detail="Game not found")
 
-    if session.step != GameStep.NIGHT_ACTION:
+    if session.step is not GameStep.NIGHT_ACTION:
         raise HTTPException(status_code=400, detail="Invalid step")
 
     # バリデーション: 対象が候補に含まれているか
     candidates = get_night_action_candidates(session)
-    candidate_names = {p.name for p in candidates}
-    if target not in candidate_names:
+    if not any(p.name == target for p in candidates):
         raise HTTPException(status_code=400, detail="無効な対象です")
 
     handle_night_action(session, target)
@@ -727,7 +727,7 @@ async def submit_vote(game_id: str, target: str = Form(...)) -> RedirectResponse
     if session is None:
         raise HTTPException(status_code=404, detail="Game not found")
 
-    if session.step != GameStep.VOTE:
+    if session.step is not GameStep.VOTE:
         raise HTTPException(status_code=400, detail="Invalid step")
 
     # バリデーション: 自分には投票不可、死亡者には投票不可
@@ -823,17 +823,17 @@ async def sse_advance_game(request: Request, game_id: str) -> StreamingResponse:
 
     def process() -> None:
         try:
-            if session.step == GameStep.ROLE_REVEAL:
+            if session.step is GameStep.ROLE_REVEAL:
                 advance_to_discussion(
                     session, on_progress=on_progress, on_message=on_message, on_token_chunk=on_token_chunk
                 )
-            elif session.step == GameStep.DISCUSSION and not human_is_alive:
+            elif session.step is GameStep.DISCUSSION and not human_is_alive:
                 skip_to_vote(session, on_progress=on_progress, on_message=on_message, on_token_chunk=on_token_chunk)
-            elif session.step == GameStep.VOTE and not human_is_alive:
+            elif session.step is GameStep.VOTE and not human_is_alive:
                 handle_auto_vote(session, on_progress=on_progress)
-            elif session.step == GameStep.EXECUTION_RESULT:
+            elif session.step is GameStep.EXECUTION_RESULT:
                 advance_from_execution_result(session, on_progress=on_progress)
-            elif session.step == GameStep.NIGHT_RESULT:
+            elif session.step is GameStep.NIGHT_RESULT:
                 advance_to_discussion(
                     session, on_progress=on_progress, on_message=on_message, on_token_chunk=on_token_chunk
                 )
@@ -851,7 +851,7 @@ async def sse_submit_discussion(request: Request, game_id: str, message: str = F
     session = _get_session_or_raise(game_id)
     debug_mode = request.query_params.get("debug") == "1"
 
-    if session.step != GameStep.DISCUSSION:
+    if session.step is not GameStep.DISCUSSION:
         raise HTTPException(status_code=400, detail="Invalid step")
 
     text = message.strip() or "..."
@@ -881,7 +881,7 @@ async def sse_submit_vote(request: Request, game_id: str, target: str = Form(...
     session = _get_session_or_raise(game_id)
     debug_mode = request.query_params.get("debug") == "1"
 
-    if session.step != GameStep.VOTE:
+    if session.step is not GameStep.VOTE:
         raise HTTPException(status_code=400, detail="Invalid step")
 
     alive_names = {p.name for p in session.game.alive_players}
@@ -911,12 +911,11 @@ async def sse_submit_night_action(request: Request, game_id: str, target: str =
     session = _get_session_or_raise(game_id)
     debug_mode = request.query_params.get("debug") == "1"
 
-    if session.step != GameStep.NIGHT_ACTION:
+    if session.step is not GameStep.NIGHT_ACTION:
         raise HTTPException(status_code=400, detail="Invalid step")
 
     candidates = get_night_action_candidates(session)
-    candidate_names = {p.name for p in candidates}
-    if target not in candidate_names:
+    if not any(p.name == target for p in candidates):
         raise HTTPException(status_code=400, detail="無効な対象です")
 
     queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
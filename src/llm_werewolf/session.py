@@ -7,9 +7,13 @@
 from __future__ import annotations
 
 import random
-import uuid
+import secrets
+import threading
+import time
+from collections.abc import Callable, Container
 from dataclasses import dataclass, field
 from enum import Enum
+from typing import Generic, TypeVar
 
 from llm_werewolf.domain.game import GameState
 from llm_werewolf.domain.player import Player
@@ -17,7 +21,7 @@ from llm_werewolf.domain.services import create_game, create_game_with_role
 from llm_werewolf.domain.value_objects import NightActionType, Role, Team
 from llm_werewolf.engine.action_provider import ActionProvider
 from llm_werewolf.engine.game_engine import GameEngine
-from llm_werewolf.engine.game_logic import execute_initial_divine, get_discussion_rounds
+from llm_werewolf.engine.game_logic import execute_initial_divine, format_game_over, get_discussion_rounds
 from llm_werewolf.engine.game_master import GameMasterProvider
 from llm_werewolf.engine.interactive_engine import (
     InteractiveGameEngine,
@@ -34,6 +38,12 @@ from llm_werewolf.engine.random_provider import RandomActionProvider
 AI_NAMES: list[str] = ["AI-1", "AI-2", "AI-3", "AI-4", "AI-5", "AI-6", "AI-7", "AI-8"]
 
 MAX_SESSIONS = 100
+# 最終アクセスからこの秒数を過ぎたセッションは破棄する
+SESSION_TTL_SECONDS = 60 * 60
+# 上限到達時、最も長く触られていないセッションがこの秒数以上放置されていれば破棄して空きを作る
+SESSION_IDLE_EVICTION_SECONDS = 10 * 60
+
+_T = TypeVar("_T")
 
 
 class SessionLimitExceeded(Exception):
@@ -52,12 +62,13 @@ class GameStep(str, Enum):
     GAME_OVER = "game_over"
 
 
-@dataclass
+@dataclass(slots=True)
 class InteractiveSession:
     """インタラクティブゲームセッション（可変オブジェクト）。
 
     ステップ進行関数がフィールドを直接変更する。
     ドメイン層の frozen dataclass とは異なり、インフラ層のセッション管理として可変設計。
+    ストアに多数のセッションを保持するため ``__slots__`` でインスタンスごとの ``__dict__`` を省く。
     """
 
     game_id: str
@@ -75,14 +86,122 @@ class InteractiveSession:
     winner: Team | None = None
     gm_provider: GameMasterProvider | None = None
     player_metrics: dict[str, GameMetrics] = field(default_factory=dict)
+    pending_divine_log: str | None = None
+    discussion_order: tuple[str, ...] = ()
+    human_order_index: int | None = None
 
 
-class GameSessionStore:
-    """ゲームセッションのインメモリストア。"""
+def _new_game_id(taken: Container[str]) -> str:
+    """8 桁 16 進のゲームIDを生成する。
+
+    32 ビットの乱数なので衝突はほぼ起きず、通常は 1 回の生成で返る。
+    URL に載るため推測不能な ``secrets`` を使う。
+    """
+    game_id = secrets.token_hex(4)
+    while game_id in taken:
+        game_id = secrets.token_hex(4)
+    return game_id
 
-    def __init__(self, max_sessions: int = MAX_SESSIONS) -> None:
-        self._sessions: dict[str, GameState] = {}
+
+class _SessionStore(Generic[_T]):
+    """インメモリストアの共通部分。
+
+    セッションごとに最終アクセス時刻を記録し、ttl_seconds を過ぎても
+    触られていないセッションは作成・一覧取得時の掃除で破棄する。
+    上限に達した状態で作成要求が来た場合は、最も長く触られていないセッションが
+    idle_eviction_seconds 以上放置されていればそれを破棄し、全セッションが
+    それより最近に使われているときのみ SessionLimitExceeded を送出する。
+
+    get は毎リクエスト呼ばれるためロックを取らない。CPython の dict の
+    単一操作（get / 代入）は GIL 下でアトミックなので、参照と最終アクセス
+    時刻の更新はそれぞれ単独で安全に行える。複数の dict 操作をまたぐ処理
+    （ID 採番〜登録、上書き、削除、掃除）はロックで直列化する。
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = MAX_SESSIONS,
+        ttl_seconds: float | None = SESSION_TTL_SECONDS,
+        idle_eviction_seconds: float | None = SESSION_IDLE_EVICTION_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._sessions: dict[str, _T] = {}
+        self._last_access: dict[str, float] = {}
         self._max_sessions = max_sessions
+        self._ttl_seconds = ttl_seconds
+        self._idle_eviction_seconds = idle_eviction_seconds
+        self._clock = clock
+        # ID 採番〜登録、上書き・削除・掃除を直列化する（ゲーム実行などの重い処理はロック外）
+        self._lock = threading.Lock()
+
+    def _check_capacity(self) -> None:
+        """空きを確保する。確保できなければ SessionLimitExceeded を送出する。呼び出し側でロックを保持すること。"""
+        self._evict_expired()
+        if len(self._sessions) >= self._max_sessions:
+            self._evict_least_recent_idle()
+        if len(self._sessions) >= self._max_sessions:
+            raise SessionLimitExceeded("セッション数が上限に達しました")
+
+    def _evict_least_recent_idle(self) -> None:
+        """最も長く触られていないセッションが十分放置されていれば破棄する。呼び出し側でロックを保持すること。"""
+        if self._idle_eviction_seconds is None or not self._sessions:
+            return
+        now = self._clock()
+        least_recent = min(self._sessions, key=lambda gid: self._last_access.get(gid, now))
+        if self._last_access.get(least_recent, now) <= now - self._idle_eviction_seconds:
+            self._remove(least_recent)
+
+    def _is_expired(self, game_id: str, now: float) -> bool:
+        if self._ttl_seconds is None:
+            return False
+        return self._last_access.get(game_id, now) <= now - self._ttl_seconds
+
+    def _evict_expired(self) -> None:
+        """期限切れセッションを破棄する。呼び出し側でロックを保持すること。"""
+        if self._ttl_seconds is None:
+            return
+        now = self._clock()
+        # ロック外の get が書き込み中でも壊れないよう、キーのスナップショットを走査する。
+        # 万一セッション本体のない時刻だけのエントリが残っていれば、それも合わせて掃除する
+        stale = [gid for gid in list(self._last_access) if gid not in self._sessions or self._is_expired(gid, now)]
+        for game_id in stale:
+            self._remove(game_id)
+
+    def _generate_unique_id(self) -> str:
+        """衝突しない一意なゲームIDを生成する。呼び出し側でロックを保持すること。"""
+        return _new_game_id(self._sessions)
+
+    def _put(self, game_id: str, value: _T) -> None:
+        """セッションを登録し、最終アクセス時刻を更新する。呼び出し側でロックを保持すること。"""
+        self._sessions[game_id] = value
+        self._last_access[game_id] = self._clock()
+
+    def _remove(self, game_id: str) -> None:
+        self._sessions.pop(game_id, None)
+        self._last_access.pop(game_id, None)
+
+    def get(self, game_id: str) -> _T | None:
+        """セッションを取得する。期限切れの場合は None を返す（実際の破棄は次回の掃除で行う）。"""
+        value = self._sessions.get(game_id)
+        if value is None:
+            return None
+        now = self._clock()
+        # TTL 無効時も最終アクセス時刻は更新する（アイドル破棄の順位付けに使うため）
+        if self._is_expired(game_id, now):
+            return None
+        # 削除済みのセッションに時刻だけを書き戻さないよう、存在する場合に限り更新する
+        if game_id in self._sessions:
+            self._last_access[game_id] = now
+        return value
+
+    def delete(self, game_id: str) -> None:
+        """セッションを削除する。"""
+        with self._lock:
+            self._remove(game_id)
+
+
+class GameSessionStore(_SessionStore[GameState]):
+    """ゲームセッションのインメモリストア。"""
 
     def create(
         self,
@@ -103,9 +222,8 @@ class GameSessionStore:
         Raises:
             SessionLimitExceeded: セッション数が上限に達した場合
         """
-        if len(self._sessions) >= self._max_sessions:
-            raise SessionLimitExceeded("セッション数が上限に達しました")
-        game_id = self._generate_unique_id()
+        with self._lock:
+            self._check_capacity()
         initial_state = create_game(player_names, rng=rng)
 
         gm_provider: GameMasterProvider | None = None
@@ -130,41 +248,27 @@ class GameSessionStore:
         engine = GameEngine(initial_state, providers, rng=rng, gm_provider=gm_provider)
         final_state = engine.run()
 
-        self._sessions[game_id] = final_state
+        with self._lock:
+            self._check_capacity()
+            game_id = self._generate_unique_id()
+            self._put(game_id, final_state)
         return game_id, final_state
 
-    def _generate_unique_id(self) -> str:
-        """衝突しない一意なゲームIDを生成する。"""
-        for _ in range(10):
-            game_id = uuid.uuid4().hex[:8]
-            if game_id not in self._sessions:
-                return game_id
-        raise RuntimeError("Failed to generate unique game_id")
-
-    def get(self, game_id: str) -> GameState | None:
-        """ゲーム状態を取得する。"""
-        return self._sessions.get(game_id)
-
     def save(self, game_id: str, game: GameState) -> None:
         """ゲーム状態を保存（上書き）する。"""
-        self._sessions[game_id] = game
-
-    def delete(self, game_id: str) -> None:
-        """セッションを削除する。"""
-        self._sessions.pop(game_id, None)
+        with self._lock:
+            self._put(game_id, game)
 
     def list_sessions(self) -> dict[str, GameState]:
         """全セッションを返す。"""
-        return dict(self._sessions)
+        with self._lock:
+            self._evict_expired()
+            return dict(self._sessions)
 
 
-class InteractiveSessionStore:
+class InteractiveSessionStore(_SessionStore[InteractiveSession]):
     """インタラクティブゲームセッションのインメモリストア。"""
 
-    def __init__(self, max_sessions: int = MAX_SESSIONS) -> None:
-        self._sessions: dict[str, InteractiveSession] = {}
-        self._max_sessions = max_sessions
-
     def create(
         self,
         human_name: str,
@@ -183,19 +287,17 @@ class InteractiveSessionStore:
         Raises:
             SessionLimitExceeded: セッション数が上限に達した場合
         """
-        if len(self._sessions) >= self._max_sessions:
-            raise SessionLimitExceeded("セッション数が上限に達しました")
+        with self._lock:
+            self._check_capacity()
         rng = rng if rng is not None else random.Random()
-        all_names = [human_name] + AI_NAMES
+        all_names = [human_name, *AI_NAMES]
         if role is not None:
             game = create_game_with_role(all_names, human_name, role, rng=rng)
         else:
             game = create_game(all_names, rng=rng)
 
         # 配役ログ
-        game = game.add_log("=== ゲーム開始 ===")
-        for p in game.players:
-            game = game.add_log(f"[配役] {p.name}: {p.role.value}")
+        game = game.add_logs(["=== ゲーム開始 ===", *(f"[配役] {p.name}: {p.role.value}" for p in game.players)])
 
         # 初日占い
         game = execute_initial_divine(game, rng)
@@ -209,7 +311,7 @@ class InteractiveSessionStore:
             base_providers: dict[str, ActionProvider] = {
                 name: LLMActionProvider(
                     config,
-                    rng=random.Random(rng.randint(0, 2**32)),
+                    rng=random.Random(rng.getrandbits(64)),
                     personality=build_personality(traits),
                     prompt_config=prompt_config,
                 )
@@ -228,42 +330,34 @@ class InteractiveSessionStore:
             except ValueError:
                 pass
         else:
-            providers = {name: RandomActionProvider(rng=random.Random(rng.randint(0, 2**32))) for name in AI_NAMES}
+            providers = {name: RandomActionProvider(rng=random.Random(rng.getrandbits(64))) for name in AI_NAMES}
 
         # 発言順をランダムで決定
-        speaking_order = tuple(rng.sample(all_names, len(all_names)))
-
-        game_id = self._generate_unique_id()
-        session = InteractiveSession(
-            game_id=game_id,
-            game=game,
-            human_player_name=human_name,
-            step=GameStep.ROLE_REVEAL,
-            providers=providers,
-            rng=rng,
-            speaking_order=speaking_order,
-            display_order=speaking_order,
-            gm_provider=gm_provider,
-            player_metrics=player_metrics,
-        )
-        self._sessions[game_id] = session
+        # all_names はこれ以降使わないため、その場でシャッフルする（sample より軽い Fisher-Yates）
+        rng.shuffle(all_names)
+        speaking_order = tuple(all_names)
+
+        with self._lock:
+            self._check_capacity()
+            game_id = self._generate_unique_id()
+            session = InteractiveSession(
+                game_id=game_id,
+                game=game,
+                human_player_name=human_name,
+                step=GameStep.ROLE_REVEAL,
+                providers=providers,
+                rng=rng,
+                speaking_order=speaking_order,
+                display_order=speaking_order,
+                gm_provider=gm_provider,
+                player_metrics=player_metrics,
+            )
+            self._put(game_id, session)
         return session
 
-    def _generate_unique_id(self) -> str:
-        for _ in range(10):
-            game_id = uuid.uuid4().hex[:8]
-            if game_id not in self._sessions:
-                return game_id
-        raise RuntimeError("Failed to generate unique game_id")
-
-    def get(self, game_id: str) -> InteractiveSession | None:
-        return self._sessions.get(game_id)
-
     def save(self, session: InteractiveSession) -> None:
-        self._sessions[session.game_id] = session
-
-    def delete(self, game_id: str) -> None:
-        self._sessions.pop(game_id, None)
+        with self._lock:
+            self._put(session.game_id, session)
 
 
 # --- ステップ進行関数群 ---
@@ -288,6 +382,9 @@ def _create_engine(
         on_progress=on_progress,
         on_message=on_message,
         on_token_chunk=on_token_chunk,
+        pending_divine_log=session.pending_divine_log,
+        discussion_order=session.discussion_order,
+        human_order_index=session.human_order_index,
     )
 
 
@@ -296,6 +393,9 @@ def _sync_engine_to_session(session: InteractiveSession, engine: InteractiveGame
     session.game = engine.game
     session.speaking_order = engine.speaking_order
     session.discussion_round = engine.discussion_round
+    session.pending_divine_log = engine.pending_divine_log
+    session.discussion_order = engine.discussion_order
+    session.human_order_index = engine.human_order_index
 
 
 def advance_to_discussion(
@@ -374,6 +474,12 @@ def handle_auto_vote(
     session.step = GameStep.EXECUTION_RESULT
 
 
+def get_night_action(session: InteractiveSession) -> tuple[NightActionType | None, list[Player]]:
+    """ユーザーの夜行動タイプと対象候補をまとめて返す。"""
+    engine = _create_engine(session)
+    return engine.get_night_action()
+
+
 def get_night_action_type(session: InteractiveSession) -> NightActionType | None:
     """ユーザーの夜行動タイプを返す。"""
     engine = _create_engine(session)
@@ -403,13 +509,11 @@ def start_night_phase(
 ) -> None:
     """夜フェーズを開始する。ユーザーに夜行動があれば NIGHT_ACTION へ遷移、なければ即解決。"""
     engine = _create_engine(session, on_progress=on_progress)
-    has_action = engine.start_night()
-    _sync_engine_to_session(session, engine)
-
-    if has_action:
+    if engine.start_night():
+        _sync_engine_to_session(session, engine)
         session.step = GameStep.NIGHT_ACTION
     else:
-        resolve_night_phase(session, on_progress=on_progress)
+        _resolve_night_with(session, engine)
 
 
 def handle_night_action(
@@ -418,27 +522,20 @@ def handle_night_action(
     on_progress: ProgressCallback | None = None,
 ) -> None:
     """ユーザーの夜行動（占い or 襲撃対象選択）を処理し、夜フェーズを解決する。"""
+    # 行動判定から夜の解決まで同じエンジンを使う
     engine = _create_engine(session, on_progress=on_progress)
-    action_type = engine.get_night_action_type()
-
-    if action_type is None:
-        resolve_night_phase(session, on_progress=on_progress)
-        return
-
-    candidates = engine.get_night_action_candidates()
-    candidate_names = {p.name for p in candidates}
-    if target_name not in candidate_names:
-        resolve_night_phase(session, on_progress=on_progress)
-        return
+    action_type, candidates = engine.get_night_action()
 
-    if action_type == NightActionType.DIVINE:
-        resolve_night_phase(session, human_divine_target=target_name, on_progress=on_progress)
+    if action_type is None or not any(p.name == target_name for p in candidates):
+        _resolve_night_with(session, engine)
+    elif action_type == NightActionType.DIVINE:
+        _resolve_night_with(session, engine, human_divine_target=target_name)
     elif action_type == NightActionType.ATTACK:
-        resolve_night_phase(session, human_attack_target=target_name, on_progress=on_progress)
+        _resolve_night_with(session, engine, human_attack_target=target_name)
     elif action_type == NightActionType.GUARD:
-        resolve_night_phase(session, human_guard_target=target_name, on_progress=on_progress)
+        _resolve_night_with(session, engine, human_guard_target=target_name)
     else:
-        resolve_night_phase(session, on_progress=on_progress)
+        _resolve_night_with(session, engine)
 
 
 def resolve_night_phase(
@@ -450,6 +547,17 @@ def resolve_night_phase(
 ) -> None:
     """夜フェーズを解決する（占い + 護衛 + 襲撃 + 勝利判定）。"""
     engine = _create_engine(session, on_progress=on_progress)
+    _resolve_night_with(session, engine, human_divine_target, human_attack_target, human_guard_target)
+
+
+def _resolve_night_with(
+    session: InteractiveSession,
+    engine: InteractiveGameEngine,
+    human_divine_target: str | None = None,
+    human_attack_target: str | None = None,
+    human_guard_target: str | None = None,
+) -> None:
+    """生成済みのエンジンで夜フェーズを解決し、結果をセッションに反映する。"""
     night_messages, winner = engine.resolve_night(human_divine_target, human_attack_target, human_guard_target)
     _sync_engine_to_session(session, engine)
     session.night_messages = night_messages
@@ -462,7 +570,6 @@ def resolve_night_phase(
 
 def _set_game_over(session: InteractiveSession, winner: Team) -> None:
     """ゲーム終了を設定する。"""
-    label = "村人陣営" if winner == Team.VILLAGE else "人狼陣営"
-    session.game = session.game.add_log(f"=== ゲーム終了: {label}の勝利 ===")
+    session.game = session.game.add_log(format_game_over(winner))
     session.winner = winner
     session.step = GameStep.GAME_OVER
@@ -35,6 +35,18 @@ class TestGameState:
         assert len(game.alive_werewolves) == 1
         assert game.alive_werewolves[0].role == Role.WEREWOLF
 
+    def test_alive_by_role(self, players: tuple[Player, ...]) -> None:
+        game = GameState(players=(players[0].killed(),) + players[1:])
+        assert game.alive_by_role[Role.VILLAGER] == (players[2], players[3])
+        assert game.alive_by_role[Role.SEER] == (players[1],)
+        assert Role.KNIGHT not in game.alive_by_role
+
+    def test_alive_views_are_computed_once_per_state(self, players: tuple[Player, ...]) -> None:
+        game = GameState(players=players)
+        assert game.alive_players is game.alive_players
+        assert game.alive_werewolves is game.alive_werewolves
+        assert game.alive_village_team is game.alive_village_team
+
     def test_alive_village_team(self, players: tuple[Player, ...]) -> None:
         game = GameState(players=players)
         village_team = game.alive_village_team
@@ -54,6 +66,41 @@ class TestGameState:
         assert len(game.log) == 2
         assert game.log[0] == "Day 1 started"
 
+    def test_add_logs(self, players: tuple[Player, ...]) -> None:
+        game = GameState(players=players).add_log("Day 1 started")
+        new_game = game.add_logs(["Alice voted for Eve", "Bob voted for Eve"])
+        assert new_game.log == ("Day 1 started", "Alice voted for Eve", "Bob voted for Eve")
+        # 元の GameState は変更されない
+        assert game.log == ("Day 1 started",)
+
+    def test_add_logs_empty_returns_same_state(self, players: tuple[Player, ...]) -> None:
+        game = GameState(players=players)
+        assert game.add_logs([]) is game
+
+    def test_apply_updates(self, players: tuple[Player, ...]) -> None:
+        game = GameState(players=players, phase=Phase.NIGHT, log=("Night 1",))
+        dead = players[0].killed()
+        new_game = game.apply_updates(
+            replaced_players=[(players[0], dead)],
+            logs=["Alice was attacked"],
+            divined=[("Bob", "Eve")],
+            medium_results=[(1, "Charlie", False)],
+            phase=Phase.DAY,
+            day=2,
+        )
+        assert new_game.players[0] is dead
+        assert new_game.log == ("Night 1", "Alice was attacked")
+        assert new_game.divined_history == (("Bob", "Eve"),)
+        assert new_game.medium_results == ((1, "Charlie", False),)
+        assert (new_game.phase, new_game.day) == (Phase.DAY, 2)
+        # 元の GameState は変更されない
+        assert game.players[0] is players[0]
+        assert game.phase == Phase.NIGHT
+
+    def test_apply_updates_without_changes_keeps_fields(self, players: tuple[Player, ...]) -> None:
+        game = GameState(players=players, phase=Phase.NIGHT, day=3)
+        assert game.apply_updates() == game
+
     def test_replace_player(self, players: tuple[Player, ...]) -> None:
         game = GameState(players=players)
         old_player = players[0]
@@ -81,6 +128,15 @@ class TestGameState:
         assert game.find_player("Alice", alive_only=False) is not None
         assert game.find_player("Alice", alive_only=True) is None
 
+    def test_players_by_name(self, players: tuple[Player, ...]) -> None:
+        game = GameState(players=players)
+        assert game.players_by_name["Alice"] is players[0]
+        assert set(game.players_by_name) == {p.name for p in players}
+        # 置き換え後の GameState では新しいプレイヤーが引ける
+        dead = players[0].killed()
+        new_game = game.replace_player(players[0], dead)
+        assert new_game.players_by_name["Alice"] is dead
+
     def test_frozen(self, players: tuple[Player, ...]) -> None:
         game = GameState(players=players)
         with pytest.raises(AttributeError):
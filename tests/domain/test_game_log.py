@@ -4,33 +4,59 @@ import pytest
 
 from llm_werewolf.domain.game import GameState
 from llm_werewolf.domain.game_log import filter_log_entries, format_log_for_context, format_public_log
+from llm_werewolf.domain.player import Player
 from llm_werewolf.domain.services import create_game
+from llm_werewolf.domain.value_objects import Role
 from llm_werewolf.engine.game_engine import GameEngine
 from llm_werewolf.engine.random_provider import RandomActionProvider
 
+# 複数のテストで共有するプレイヤー構成（Player は不変なので共有して安全）
+_VILLAGER_WEREWOLF_PAIR = (
+    Player(name="Alice", role=Role.VILLAGER),
+    Player(name="Bob", role=Role.WEREWOLF),
+)
 
-def _run_game(seed: int = 42) -> tuple[list[str], GameState]:
-    """テスト用にゲームを実行し、(player_names, game) を返す。"""
-    rng = random.Random(seed)
+
+@pytest.fixture(scope="module")
+def game() -> GameState:
+    """テスト用に 1 度だけゲームを実行し、終了時のゲーム状態を返す。
+
+    GameState は不変なので、モジュール内のテストで共有しても安全。
+    """
+    rng = random.Random(42)
     player_names = ["Alice", "Bob", "Charlie", "Diana", "Eve", "Frank", "Grace", "Heidi", "Ivan"]
-    game = create_game(player_names, rng=rng)
-    providers = {p.name: RandomActionProvider(rng=rng) for p in game.players}
-    engine = GameEngine(game, providers, rng=rng)
-    final = engine.run()
-    return player_names, final
+    initial = create_game(player_names, rng=rng)
+    providers = {p.name: RandomActionProvider(rng=rng) for p in initial.players}
+    return GameEngine(initial, providers, rng=rng).run()
+
+
+@pytest.fixture(scope="module")
+def knight_game() -> GameState:
+    players = (
+        Player(name="Alice", role=Role.KNIGHT),
+        Player(name="Bob", role=Role.WEREWOLF),
+        Player(name="Charlie", role=Role.VILLAGER),
+    )
+    return GameState(players=players, log=("[護衛] Aliceが Charlieを護衛した",))
+
+
+@pytest.fixture(scope="module")
+def medium_game() -> GameState:
+    players = (
+        Player(name="Alice", role=Role.MEDIUM),
+        Player(name="Bob", role=Role.WEREWOLF),
+        Player(name="Charlie", role=Role.VILLAGER),
+    )
+    return GameState(players=players, log=("[霊媒結果] Aliceの霊媒: Bobは人狼だった",))
 
 
 class TestFormatLogForContext:
-    def test_raises_for_unknown_player(self) -> None:
-        _, game = _run_game()
+    def test_raises_for_unknown_player(self, game: GameState) -> None:
         with pytest.raises(ValueError, match="Player 'Unknown' not found"):
             format_log_for_context(game, "Unknown")
 
-    def test_villager_cannot_see_others_role_assignment(self) -> None:
-        _, game = _run_game()
+    def test_villager_cannot_see_others_role_assignment(self, game: GameState) -> None:
         # 村人を探す
-        from llm_werewolf.domain.value_objects import Role
-
         villager = next(p for p in game.players if p.role == Role.VILLAGER)
         log_text = format_log_for_context(game, villager.name)
 
@@ -42,21 +68,15 @@ class TestFormatLogForContext:
             if p.name != villager.name:
                 assert f"[配役] {p.name}" not in log_text
 
-    def test_seer_can_see_divine_logs(self) -> None:
-        _, game = _run_game()
-        from llm_werewolf.domain.value_objects import Role
-
+    def test_seer_can_see_divine_logs(self, game: GameState) -> None:
         seer = next(p for p in game.players if p.role == Role.SEER)
         log_text = format_log_for_context(game, seer.name)
 
         # 占い師は占いログが見える
-        if "[占い]" in "\n".join(game.log):
+        if any(entry.startswith("[占い]") for entry in game.log):
             assert "[占い]" in log_text
 
-    def test_non_seer_cannot_see_divine_logs(self) -> None:
-        _, game = _run_game()
-        from llm_werewolf.domain.value_objects import Role
-
+    def test_non_seer_cannot_see_divine_logs(self, game: GameState) -> None:
         non_seer = next(p for p in game.players if p.role != Role.SEER)
         log_text = format_log_for_context(game, non_seer.name)
 
@@ -64,22 +84,19 @@ class TestFormatLogForContext:
         assert "[占い]" not in log_text
         assert "[占い結果]" not in log_text
 
-    def test_all_players_can_see_discussion_and_vote(self) -> None:
-        _, game = _run_game()
+    def test_all_players_can_see_discussion_and_vote(self, game: GameState) -> None:
         for p in game.players:
             log_text = format_log_for_context(game, p.name)
             assert "[発言]" in log_text
             assert "[投票]" in log_text
 
-    def test_all_players_can_see_game_start_and_end(self) -> None:
-        _, game = _run_game()
+    def test_all_players_can_see_game_start_and_end(self, game: GameState) -> None:
         for p in game.players:
             log_text = format_log_for_context(game, p.name)
             assert "=== ゲーム開始 ===" in log_text
             assert "=== ゲーム終了" in log_text
 
-    def test_all_players_can_see_execution(self) -> None:
-        _, game = _run_game()
+    def test_all_players_can_see_execution(self, game: GameState) -> None:
         for p in game.players:
             log_text = format_log_for_context(game, p.name)
             assert "[処刑]" in log_text
@@ -88,62 +105,26 @@ class TestFormatLogForContext:
 class TestGuardLogVisibility:
     """護衛ログの可視性テスト"""
 
-    def test_knight_can_see_own_guard_log(self) -> None:
-        from llm_werewolf.domain.player import Player
-        from llm_werewolf.domain.value_objects import Role
-
-        players = (
-            Player(name="Alice", role=Role.KNIGHT),
-            Player(name="Bob", role=Role.WEREWOLF),
-            Player(name="Charlie", role=Role.VILLAGER),
-        )
-        game = GameState(players=players, log=("[護衛] Aliceが Charlieを護衛した",))
-        log_text = format_log_for_context(game, "Alice")
+    def test_knight_can_see_own_guard_log(self, knight_game: GameState) -> None:
+        log_text = format_log_for_context(knight_game, "Alice")
         assert "[護衛]" in log_text
 
-    def test_non_knight_cannot_see_guard_log(self) -> None:
-        from llm_werewolf.domain.player import Player
-        from llm_werewolf.domain.value_objects import Role
-
-        players = (
-            Player(name="Alice", role=Role.KNIGHT),
-            Player(name="Bob", role=Role.WEREWOLF),
-            Player(name="Charlie", role=Role.VILLAGER),
-        )
-        game = GameState(players=players, log=("[護衛] Aliceが Charlieを護衛した",))
+    def test_non_knight_cannot_see_guard_log(self, knight_game: GameState) -> None:
         for name in ("Bob", "Charlie"):
-            log_text = format_log_for_context(game, name)
+            log_text = format_log_for_context(knight_game, name)
             assert "[護衛]" not in log_text
 
 
 class TestMediumResultLogVisibility:
     """霊媒結果ログの可視性テスト"""
 
-    def test_medium_can_see_own_medium_result_log(self) -> None:
-        from llm_werewolf.domain.player import Player
-        from llm_werewolf.domain.value_objects import Role
-
-        players = (
-            Player(name="Alice", role=Role.MEDIUM),
-            Player(name="Bob", role=Role.WEREWOLF),
-            Player(name="Charlie", role=Role.VILLAGER),
-        )
-        game = GameState(players=players, log=("[霊媒結果] Aliceの霊媒: Bobは人狼だった",))
-        log_text = format_log_for_context(game, "Alice")
+    def test_medium_can_see_own_medium_result_log(self, medium_game: GameState) -> None:
+        log_text = format_log_for_context(medium_game, "Alice")
         assert "[霊媒結果]" in log_text
 
-    def test_non_medium_cannot_see_medium_result_log(self) -> None:
-        from llm_werewolf.domain.player import Player
-        from llm_werewolf.domain.value_objects import Role
-
-        players = (
-            Player(name="Alice", role=Role.MEDIUM),
-            Player(name="Bob", role=Role.WEREWOLF),
-            Player(name="Charlie", role=Role.VILLAGER),
-        )
-        game = GameState(players=players, log=("[霊媒結果] Aliceの霊媒: Bobは人狼だった",))
+    def test_non_medium_cannot_see_medium_result_log(self, medium_game: GameState) -> None:
         for name in ("Bob", "Charlie"):
-            log_text = format_log_for_context(game, name)
+            log_text = format_log_for_context(medium_game, name)
             assert "[霊媒結果]" not in log_text
 
 
@@ -151,9 +132,6 @@ class TestWerewolfAllyLogVisibility:
     """人狼仲間ログの可視性テスト"""
 
     def test_werewolf_can_see_ally_log(self) -> None:
-        from llm_werewolf.domain.player import Player
-        from llm_werewolf.domain.value_objects import Role
-
         players = (
             Player(name="Alice", role=Role.WEREWOLF),
             Player(name="Bob", role=Role.WEREWOLF),
@@ -165,9 +143,6 @@ class TestWerewolfAllyLogVisibility:
             assert "[人狼仲間]" in log_text
 
     def test_non_werewolf_cannot_see_ally_log(self) -> None:
-        from llm_werewolf.domain.player import Player
-        from llm_werewolf.domain.value_objects import Role
-
         players = (
             Player(name="Alice", role=Role.WEREWOLF),
             Player(name="Bob", role=Role.WEREWOLF),
@@ -180,44 +155,40 @@ class TestWerewolfAllyLogVisibility:
             log_text = format_log_for_context(game, name)
             assert "[人狼仲間]" not in log_text
 
+    def test_named_player_without_role_cannot_see_private_result(self) -> None:
+        """名前が含まれていても、役職条件を満たさなければ非公開ログは見えない。"""
+        players = (
+            Player(name="Alice", role=Role.SEER),
+            Player(name="Bob", role=Role.MADMAN),
+            Player(name="Charlie", role=Role.KNIGHT),
+        )
+        game = GameState(
+            players=players,
+            log=(
+                "[占い結果] Alice が Bob を占った結果: 人狼ではない",
+                "[護衛] Charlie が Bob を護衛した",
+                "[護衛成功] 襲撃は護衛により阻止された",
+            ),
+        )
+        assert format_log_for_context(game, "Bob") == "[護衛成功] 襲撃は護衛により阻止された"
+
 
 class TestThinkingLogVisibility:
     """[思考] ログの可視性テスト"""
 
     def test_player_can_see_own_thinking_log(self) -> None:
-        from llm_werewolf.domain.player import Player
-        from llm_werewolf.domain.value_objects import Role
-
-        players = (
-            Player(name="Alice", role=Role.VILLAGER),
-            Player(name="Bob", role=Role.WEREWOLF),
-        )
-        game = GameState(players=players, log=("[思考] Alice: Bobが怪しいと思う",))
+        game = GameState(players=_VILLAGER_WEREWOLF_PAIR, log=("[思考] Alice: Bobが怪しいと思う",))
         log_text = format_log_for_context(game, "Alice")
         assert "[思考] Alice" in log_text
 
     def test_other_player_cannot_see_thinking_log(self) -> None:
-        from llm_werewolf.domain.player import Player
-        from llm_werewolf.domain.value_objects import Role
-
-        players = (
-            Player(name="Alice", role=Role.VILLAGER),
-            Player(name="Bob", role=Role.WEREWOLF),
-        )
-        game = GameState(players=players, log=("[思考] Alice: Bobが怪しいと思う",))
+        game = GameState(players=_VILLAGER_WEREWOLF_PAIR, log=("[思考] Alice: Bobが怪しいと思う",))
         log_text = format_log_for_context(game, "Bob")
         assert "[思考]" not in log_text
 
     def test_thinking_log_excluded_from_public_log(self) -> None:
-        from llm_werewolf.domain.player import Player
-        from llm_werewolf.domain.value_objects import Role
-
-        players = (
-            Player(name="Alice", role=Role.VILLAGER),
-            Player(name="Bob", role=Role.WEREWOLF),
-        )
         game = GameState(
-            players=players,
+            players=_VILLAGER_WEREWOLF_PAIR,
             log=(
                 "[思考] Alice: Bobが怪しい",
                 "[発言] Alice: おはよう",
@@ -229,9 +200,6 @@ class TestThinkingLogVisibility:
         assert "[発言] Alice: おはよう" in result
 
     def test_filter_log_entries_thinking_visibility(self) -> None:
-        from llm_werewolf.domain.player import Player
-        from llm_werewolf.domain.value_objects import Role
-
         player = Player(name="Alice", role=Role.VILLAGER)
         entries = [
             "[思考] Alice: 自分の思考",
@@ -248,9 +216,6 @@ class TestFormatPublicLog:
     """format_public_log のテスト。"""
 
     def test_excludes_private_entries(self) -> None:
-        from llm_werewolf.domain.player import Player
-        from llm_werewolf.domain.value_objects import Role
-
         players = (
             Player(name="Alice", role=Role.SEER),
             Player(name="Bob", role=Role.WEREWOLF),
@@ -285,9 +250,6 @@ class TestFormatPublicLog:
         assert "[思考]" not in result
 
     def test_empty_log(self) -> None:
-        from llm_werewolf.domain.player import Player
-        from llm_werewolf.domain.value_objects import Role
-
         players = (Player(name="Alice", role=Role.VILLAGER),)
         game = GameState(players=players)
         result = format_public_log(game)
@@ -295,9 +257,6 @@ class TestFormatPublicLog:
 
     def test_max_recent_statements_limits_statements(self) -> None:
         """max_recent_statements で発言ログを直近N件に制限する。"""
-        from llm_werewolf.domain.player import Player
-        from llm_werewolf.domain.value_objects import Role
-
         players = (Player(name="Alice", role=Role.VILLAGER),)
         game = GameState(
             players=players,
@@ -316,9 +275,6 @@ class TestFormatPublicLog:
 
     def test_max_recent_statements_zero_removes_all_statements(self) -> None:
         """max_recent_statements=0 で全発言が除外される。"""
-        from llm_werewolf.domain.player import Player
-        from llm_werewolf.domain.value_objects import Role
-
         players = (Player(name="Alice", role=Role.VILLAGER),)
         game = GameState(
             players=players,
@@ -333,9 +289,6 @@ class TestFormatPublicLog:
 
     def test_max_recent_statements_negative_keeps_all(self) -> None:
         """負の値を指定した場合は全件保持する。"""
-        from llm_werewolf.domain.player import Player
-        from llm_werewolf.domain.value_objects import Role
-
         players = (Player(name="Alice", role=Role.VILLAGER),)
         game = GameState(
             players=players,
@@ -350,9 +303,6 @@ class TestFilterLogEntries:
     """filter_log_entries のテスト。"""
 
     def test_filters_entries_by_player(self) -> None:
-        from llm_werewolf.domain.player import Player
-        from llm_werewolf.domain.value_objects import Role
-
         player = Player(name="Alice", role=Role.VILLAGER)
         entries = [
             "[配役] Alice: villager",
@@ -364,15 +314,29 @@ class TestFilterLogEntries:
         assert "[配役] Bob" not in result
         assert "[発言] Alice: test" in result
 
+    def test_classifies_by_leading_tag_only(self) -> None:
+        """タグは行頭のものだけで判定され、本文中のタグ文字列には影響されない。"""
+        player = Player(name="Alice", role=Role.VILLAGER)
+        entries = [
+            "[発言] Alice: Bob の [配役] が気になる",
+            "[占い結果] Bob: Carol は人狼",
+            "[占い] Bob が Carol を占った",
+        ]
+        result = filter_log_entries(entries, player)
+        assert result == "[発言] Alice: Bob の [配役] が気になる"
+
+    def test_unknown_long_bracket_prefix_is_public(self) -> None:
+        """既知タグより長い括弧書きで始まる行は公開ログとして扱われる。"""
+        player = Player(name="Alice", role=Role.VILLAGER)
+        entries = ["[システムからのお知らせ] Bob の [配役] は非公開です"]
+        assert filter_log_entries(entries, player) == entries[0]
+
 
 class TestFilterLogEntriesWithLimit:
     """filter_log_entries の max_recent_statements パラメータのテスト。"""
 
     def test_default_no_limit(self) -> None:
         """デフォルト（max_recent_statements=-1）では全件保持する。"""
-        from llm_werewolf.domain.player import Player
-        from llm_werewolf.domain.value_objects import Role
-
         player = Player(name="Alice", role=Role.VILLAGER)
         entries = [f"[発言] Alice: 発言{i}" for i in range(10)]
         result = filter_log_entries(entries, player)
@@ -381,9 +345,6 @@ class TestFilterLogEntriesWithLimit:
 
     def test_limits_statements(self) -> None:
         """max_recent_statements で発言ログが制限されること。"""
-        from llm_werewolf.domain.player import Player
-        from llm_werewolf.domain.value_objects import Role
-
         player = Player(name="Alice", role=Role.VILLAGER)
         entries = [f"[発言] Alice: 発言{i}" for i in range(10)]
         result = filter_log_entries(entries, player, max_recent_statements=3)
@@ -394,9 +355,6 @@ class TestFilterLogEntriesWithLimit:
 
     def test_events_always_kept(self) -> None:
         """イベントログは制限の対象外で常に保持される。"""
-        from llm_werewolf.domain.player import Player
-        from llm_werewolf.domain.value_objects import Role
-
         player = Player(name="Alice", role=Role.VILLAGER)
         entries = [
             "[投票] Alice → Bob",
@@ -414,9 +372,6 @@ class TestFilterLogEntriesWithLimit:
 
     def test_maintains_original_order(self) -> None:
         """トリム後も元の順序が維持されること。"""
-        from llm_werewolf.domain.player import Player
-        from llm_werewolf.domain.value_objects import Role
-
         player = Player(name="Alice", role=Role.VILLAGER)
         entries = [
             "[投票] Alice → Bob",
@@ -433,9 +388,6 @@ class TestFilterLogEntriesWithLimit:
 
     def test_zero_removes_all_statements(self) -> None:
         """0 を指定した場合は全発言が除外される。"""
-        from llm_werewolf.domain.player import Player
-        from llm_werewolf.domain.value_objects import Role
-
         player = Player(name="Alice", role=Role.VILLAGER)
         entries = [
             "[投票] Alice → Bob",
@@ -452,9 +404,6 @@ class TestLogVolumeControl:
 
     def _create_game_with_statements(self, count: int) -> GameState:
         """指定数の発言ログ + イベントログを含むゲーム状態を作成する。"""
-        from llm_werewolf.domain.player import Player
-        from llm_werewolf.domain.value_objects import Role
-
         players = (
             Player(name="Alice", role=Role.VILLAGER),
             Player(name="Bob", role=Role.VILLAGER),
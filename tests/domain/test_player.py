@@ -29,3 +29,7 @@ class TestPlayer:
         player = Player(name="Alice", role=Role.VILLAGER)
         with pytest.raises(AttributeError):
             player.status = PlayerStatus.DEAD  # type: ignore[misc]
+
+    def test_uses_slots(self) -> None:
+        player = Player(name="Alice", role=Role.VILLAGER)
+        assert not hasattr(player, "__dict__")
@@ -12,19 +12,46 @@ from llm_werewolf.domain.services import (
     create_game,
     create_game_with_role,
 )
-from llm_werewolf.domain.value_objects import PlayerStatus, Role, Team
+from llm_werewolf.domain.value_objects import Role, Team
 
 PLAYER_NAMES = ["Alice", "Bob", "Charlie", "Dave", "Eve", "Frank", "Grace", "Heidi", "Ivan"]
 
 
+# 勝利判定テスト用の基本構成（全員生存）
+_VICTORY_PLAYERS = (
+    Player(name="Alice", role=Role.VILLAGER),
+    Player(name="Bob", role=Role.SEER),
+    Player(name="Charlie", role=Role.VILLAGER),
+    Player(name="Dave", role=Role.KNIGHT),
+    Player(name="Eve", role=Role.MEDIUM),
+    Player(name="Frank", role=Role.MADMAN),
+    Player(name="Grace", role=Role.VILLAGER),
+    Player(name="Heidi", role=Role.WEREWOLF),
+    Player(name="Ivan", role=Role.WEREWOLF),
+)
+
+
+def _victory_scenario(*dead_names: str) -> GameState:
+    """基本構成から指定したプレイヤーを死亡させたゲーム状態を返す。"""
+    return GameState(players=tuple(p.killed() if p.name in dead_names else p for p in _VICTORY_PLAYERS))
+
+
+@pytest.fixture(scope="module")
+def assigned_players() -> list[Player]:
+    return assign_roles(PLAYER_NAMES)
+
+
+@pytest.fixture(scope="module")
+def default_game() -> GameState:
+    return create_game(PLAYER_NAMES)
+
+
 class TestAssignRoles:
-    def test_returns_nine_players(self) -> None:
-        players = assign_roles(PLAYER_NAMES)
-        assert len(players) == 9
+    def test_returns_nine_players(self, assigned_players: list[Player]) -> None:
+        assert len(assigned_players) == 9
 
-    def test_role_composition(self) -> None:
-        players = assign_roles(PLAYER_NAMES)
-        role_counts = Counter(p.role for p in players)
+    def test_role_composition(self, assigned_players: list[Player]) -> None:
+        role_counts = Counter(p.role for p in assigned_players)
         assert role_counts[Role.VILLAGER] == 3
         assert role_counts[Role.SEER] == 1
         assert role_counts[Role.WEREWOLF] == 2
@@ -32,9 +59,8 @@ class TestAssignRoles:
         assert role_counts[Role.MEDIUM] == 1
         assert role_counts[Role.MADMAN] == 1
 
-    def test_names_preserved(self) -> None:
-        players = assign_roles(PLAYER_NAMES)
-        assert [p.name for p in players] == PLAYER_NAMES
+    def test_names_preserved(self, assigned_players: list[Player]) -> None:
+        assert [p.name for p in assigned_players] == PLAYER_NAMES
 
     def test_deterministic_with_seed(self) -> None:
         players1 = assign_roles(PLAYER_NAMES, rng=random.Random(42))
@@ -51,10 +77,9 @@ class TestAssignRoles:
 
 
 class TestCreateGame:
-    def test_returns_game_state(self) -> None:
-        game = create_game(PLAYER_NAMES)
-        assert isinstance(game, GameState)
-        assert len(game.players) == 9
+    def test_returns_game_state(self, default_game: GameState) -> None:
+        assert isinstance(default_game, GameState)
+        assert len(default_game.players) == 9
 
 
 class TestCreateGameWithRole:
@@ -86,163 +111,92 @@ class TestCreateGameWithRole:
 
 class TestCheckVictory:
     def test_village_wins_when_all_werewolves_dead(self) -> None:
-        players = (
-            Player(name="Alice", role=Role.VILLAGER),
-            Player(name="Bob", role=Role.SEER),
-            Player(name="Charlie", role=Role.VILLAGER),
-            Player(name="Dave", role=Role.KNIGHT),
-            Player(name="Eve", role=Role.MEDIUM),
-            Player(name="Frank", role=Role.MADMAN),
-            Player(name="Grace", role=Role.VILLAGER),
-            Player(name="Heidi", role=Role.WEREWOLF, status=PlayerStatus.DEAD),
-            Player(name="Ivan", role=Role.WEREWOLF, status=PlayerStatus.DEAD),
-        )
-        game = GameState(players=players)
+        game = _victory_scenario("Heidi", "Ivan")
         assert check_victory(game) == Team.VILLAGE
 
     def test_werewolf_wins_when_villagers_lte_werewolves(self) -> None:
-        players = (
-            Player(name="Alice", role=Role.VILLAGER, status=PlayerStatus.DEAD),
-            Player(name="Bob", role=Role.SEER, status=PlayerStatus.DEAD),
-            Player(name="Charlie", role=Role.VILLAGER, status=PlayerStatus.DEAD),
-            Player(name="Dave", role=Role.KNIGHT, status=PlayerStatus.DEAD),
-            Player(name="Eve", role=Role.MEDIUM, status=PlayerStatus.DEAD),
-            Player(name="Frank", role=Role.MADMAN, status=PlayerStatus.DEAD),
-            Player(name="Grace", role=Role.VILLAGER),
-            Player(name="Heidi", role=Role.WEREWOLF),
-            Player(name="Ivan", role=Role.WEREWOLF),
-        )
-        game = GameState(players=players)
+        game = _victory_scenario("Alice", "Bob", "Charlie", "Dave", "Eve", "Frank")
         assert check_victory(game) == Team.WEREWOLF
 
     def test_madman_counted_as_non_werewolf_in_victory_check(self) -> None:
         """狂人は人狼ではないため、勝利判定では人狼以外の生存者としてカウントされる。"""
-        players = (
-            Player(name="Alice", role=Role.VILLAGER, status=PlayerStatus.DEAD),
-            Player(name="Bob", role=Role.SEER, status=PlayerStatus.DEAD),
-            Player(name="Charlie", role=Role.VILLAGER, status=PlayerStatus.DEAD),
-            Player(name="Dave", role=Role.KNIGHT, status=PlayerStatus.DEAD),
-            Player(name="Eve", role=Role.MEDIUM, status=PlayerStatus.DEAD),
-            Player(name="Frank", role=Role.MADMAN),  # 狂人は人狼ではない
-            Player(name="Grace", role=Role.VILLAGER),
-            Player(name="Heidi", role=Role.WEREWOLF),
-            Player(name="Ivan", role=Role.WEREWOLF, status=PlayerStatus.DEAD),
-        )
-        game = GameState(players=players)
+        game = _victory_scenario("Alice", "Bob", "Charlie", "Dave", "Eve", "Ivan")
         # 人狼以外の生存者: Frank + Grace = 2人, 人狼生存: Heidi = 1人 → ゲーム続行
         assert check_victory(game) is None
 
     def test_madman_with_two_werewolves_ongoing(self) -> None:
         """狂人1 + 人狼2 + 村人2 = 人狼以外3人 > 人狼2人 → ゲーム続行。"""
-        players = (
-            Player(name="Alice", role=Role.VILLAGER, status=PlayerStatus.DEAD),
-            Player(name="Bob", role=Role.SEER, status=PlayerStatus.DEAD),
-            Player(name="Charlie", role=Role.VILLAGER, status=PlayerStatus.DEAD),
-            Player(name="Dave", role=Role.KNIGHT, status=PlayerStatus.DEAD),
-            Player(name="Eve", role=Role.MEDIUM),
-            Player(name="Frank", role=Role.MADMAN),
-            Player(name="Grace", role=Role.VILLAGER),
-            Player(name="Heidi", role=Role.WEREWOLF),
-            Player(name="Ivan", role=Role.WEREWOLF),
-        )
-        game = GameState(players=players)
+        game = _victory_scenario("Alice", "Bob", "Charlie", "Dave")
         # 人狼以外の生存者: Eve + Frank + Grace = 3人, 人狼: Heidi + Ivan = 2人 → ゲーム続行
         assert check_victory(game) is None
 
     def test_werewolf_wins_with_madman_alive(self) -> None:
         """狂人1 + 人狼2 + 村人1 = 人狼以外2人 ≦ 人狼2人 → 人狼勝利。"""
-        players = (
-            Player(name="Alice", role=Role.VILLAGER, status=PlayerStatus.DEAD),
-            Player(name="Bob", role=Role.SEER, status=PlayerStatus.DEAD),
-            Player(name="Charlie", role=Role.VILLAGER, status=PlayerStatus.DEAD),
-            Player(name="Dave", role=Role.KNIGHT, status=PlayerStatus.DEAD),
-            Player(name="Eve", role=Role.MEDIUM, status=PlayerStatus.DEAD),
-            Player(name="Frank", role=Role.MADMAN),
-            Player(name="Grace", role=Role.VILLAGER),
-            Player(name="Heidi", role=Role.WEREWOLF),
-            Player(name="Ivan", role=Role.WEREWOLF),
-        )
-        game = GameState(players=players)
+        game = _victory_scenario("Alice", "Bob", "Charlie", "Dave", "Eve")
         # 人狼以外の生存者: Frank + Grace = 2人, 人狼: Heidi + Ivan = 2人 → 人狼勝利
         assert check_victory(game) == Team.WEREWOLF
 
     def test_ongoing_game(self) -> None:
-        players = (
-            Player(name="Alice", role=Role.VILLAGER),
-            Player(name="Bob", role=Role.SEER),
-            Player(name="Charlie", role=Role.VILLAGER),
-            Player(name="Dave", role=Role.KNIGHT),
-            Player(name="Eve", role=Role.MEDIUM),
-            Player(name="Frank", role=Role.MADMAN),
-            Player(name="Grace", role=Role.VILLAGER, status=PlayerStatus.DEAD),
-            Player(name="Heidi", role=Role.WEREWOLF),
-            Player(name="Ivan", role=Role.WEREWOLF),
-        )
-        game = GameState(players=players)
+        game = _victory_scenario("Grace")
         assert check_victory(game) is None
 
-    def test_initial_state(self) -> None:
-        game = create_game(PLAYER_NAMES)
-        assert check_victory(game) is None
+    def test_initial_state(self, default_game: GameState) -> None:
+        assert check_victory(default_game) is None
 
 
-class TestCanGuard:
-    def _make_game(self) -> GameState:
-        return GameState(
-            players=(
-                Player(name="Alice", role=Role.KNIGHT),
-                Player(name="Bob", role=Role.WEREWOLF),
-                Player(name="Charlie", role=Role.VILLAGER),
-                Player(name="Dave", role=Role.SEER),
-                Player(name="Eve", role=Role.VILLAGER),
-                Player(name="Frank", role=Role.MEDIUM),
-                Player(name="Grace", role=Role.VILLAGER),
-                Player(name="Heidi", role=Role.WEREWOLF),
-                Player(name="Ivan", role=Role.MADMAN),
-            )
+@pytest.fixture(scope="module")
+def guard_game() -> GameState:
+    return GameState(
+        players=(
+            Player(name="Alice", role=Role.KNIGHT),
+            Player(name="Bob", role=Role.WEREWOLF),
+            Player(name="Charlie", role=Role.VILLAGER),
+            Player(name="Dave", role=Role.SEER),
+            Player(name="Eve", role=Role.VILLAGER),
+            Player(name="Frank", role=Role.MEDIUM),
+            Player(name="Grace", role=Role.VILLAGER),
+            Player(name="Heidi", role=Role.WEREWOLF),
+            Player(name="Ivan", role=Role.MADMAN),
         )
+    )
 
-    def test_valid_guard(self) -> None:
-        game = self._make_game()
-        knight = game.players[0]
-        target = game.players[2]
-        can_guard(game, knight, target)  # no exception
 
-    def test_not_knight_raises(self) -> None:
-        game = self._make_game()
-        villager = game.players[2]
-        target = game.players[3]
+class TestCanGuard:
+    def test_valid_guard(self, guard_game: GameState) -> None:
+        knight = guard_game.players[0]
+        target = guard_game.players[2]
+        can_guard(guard_game, knight, target)  # no exception
+
+    def test_not_knight_raises(self, guard_game: GameState) -> None:
+        villager = guard_game.players[2]
+        target = guard_game.players[3]
         with pytest.raises(ValueError, match="is not a knight"):
-            can_guard(game, villager, target)
+            can_guard(guard_game, villager, target)
 
-    def test_dead_knight_raises(self) -> None:
-        game = self._make_game()
-        knight = game.players[0]
+    def test_dead_knight_raises(self, guard_game: GameState) -> None:
+        knight = guard_game.players[0]
         dead_knight = knight.killed()
-        game = game.replace_player(knight, dead_knight)
+        game = guard_game.replace_player(knight, dead_knight)
         target = game.players[2]
         with pytest.raises(ValueError, match="is dead and cannot guard"):
             can_guard(game, dead_knight, target)
 
-    def test_dead_target_raises(self) -> None:
-        game = self._make_game()
-        knight = game.players[0]
-        charlie = game.players[2]
+    def test_dead_target_raises(self, guard_game: GameState) -> None:
+        knight = guard_game.players[0]
+        charlie = guard_game.players[2]
         dead_charlie = charlie.killed()
-        game = game.replace_player(charlie, dead_charlie)
+        game = guard_game.replace_player(charlie, dead_charlie)
         with pytest.raises(ValueError, match="is dead and cannot be guarded"):
             can_guard(game, knight, dead_charlie)
 
-    def test_self_guard_raises(self) -> None:
-        game = self._make_game()
-        knight = game.players[0]
+    def test_self_guard_raises(self, guard_game: GameState) -> None:
+        knight = guard_game.players[0]
         with pytest.raises(ValueError, match="cannot guard themselves"):
-            can_guard(game, knight, knight)
+            can_guard(guard_game, knight, knight)
 
-    def test_consecutive_guard_allowed(self) -> None:
+    def test_consecutive_guard_allowed(self, guard_game: GameState) -> None:
         """連続で同じ対象を護衛できる"""
-        game = self._make_game()
-        game = game.add_guard_history("Alice", "Charlie")
+        game = guard_game.add_guard_history("Alice", "Charlie")
         knight = game.players[0]
         target = game.players[2]  # Charlie
         can_guard(game, knight, target)  # no exception
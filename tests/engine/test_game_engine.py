@@ -1,6 +1,9 @@
 import random
+import re
 from dataclasses import replace
 
+import pytest
+
 from llm_werewolf.domain.game import GameState
 from llm_werewolf.domain.player import Player
 from llm_werewolf.domain.services import create_game
@@ -8,12 +11,36 @@ from llm_werewolf.domain.value_objects import Phase, PlayerStatus, Role
 from llm_werewolf.engine.game_engine import GameEngine
 from llm_werewolf.engine.random_provider import RandomActionProvider
 
+# "[発言] Alice: ..." の発言者名を取り出す
+_STATEMENT_SPEAKER_RE = re.compile(r"\[発言\] ([^:]+):")
+# "[襲撃] Alice が人狼に襲撃された" の被害者名を取り出す
+_ATTACKED_NAME_RE = re.compile(r"\[襲撃\] (\S+) が")
+
 
 def _create_all_random_providers(game: GameState, rng: random.Random) -> dict[str, RandomActionProvider]:
     """全プレイヤーに RandomActionProvider を割り当てる。"""
     return {p.name: RandomActionProvider(rng=random.Random(rng.randint(0, 2**32))) for p in game.players}
 
 
+# 昼・夜フェーズの個別テストで共有する 5 人村（GameState は不変なので共有して安全）
+_FIVE_PLAYER_GAME = GameState(
+    players=(
+        Player(name="Alice", role=Role.SEER),
+        Player(name="Bob", role=Role.WEREWOLF),
+        Player(name="Charlie", role=Role.VILLAGER),
+        Player(name="Dave", role=Role.VILLAGER),
+        Player(name="Eve", role=Role.VILLAGER),
+    )
+)
+
+
+def _create_engine(game: GameState, seed: int = 42) -> GameEngine:
+    """seed 固定の RandomActionProvider で GameEngine を生成する。"""
+    rng = random.Random(seed)
+    providers = _create_all_random_providers(game, rng)
+    return GameEngine(game=game, providers=providers, rng=rng)
+
+
 class TestGameEngineFullSimulation:
     """seed 固定で1ゲーム分のシミュレーションが完走することを確認する。"""
 
@@ -30,16 +57,16 @@ class TestGameEngineFullSimulation:
         # 勝利陣営が記録されていること
         assert any("勝利" in log for log in result.log)
 
-    def test_simulation_with_different_seeds(self) -> None:
+    @pytest.mark.parametrize("seed", [1, 10, 100, 999, 12345])
+    def test_simulation_with_different_seeds(self, seed: int) -> None:
         """複数の seed でシミュレーションが完走することを確認する。"""
-        for seed in [1, 10, 100, 999, 12345]:
-            rng = random.Random(seed)
-            game = create_game(["Alice", "Bob", "Charlie", "Dave", "Eve", "Frank", "Grace", "Heidi", "Ivan"], rng=rng)
-            providers = _create_all_random_providers(game, rng)
-            engine = GameEngine(game=game, providers=providers, rng=rng)
+        rng = random.Random(seed)
+        game = create_game(["Alice", "Bob", "Charlie", "Dave", "Eve", "Frank", "Grace", "Heidi", "Ivan"], rng=rng)
+        providers = _create_all_random_providers(game, rng)
+        engine = GameEngine(game=game, providers=providers, rng=rng)
 
-            result = engine.run()
-            assert any("ゲーム終了" in log for log in result.log)
+        result = engine.run()
+        assert any("ゲーム終了" in log for log in result.log)
 
     def test_dead_players_are_marked_dead(self) -> None:
         rng = random.Random(42)
@@ -57,26 +84,14 @@ class TestDayPhase:
     """昼フェーズの個別テスト。"""
 
     def _setup_game(self, seed: int = 42) -> tuple[GameEngine, GameState]:
-        rng = random.Random(seed)
-        game = GameState(
-            players=(
-                Player(name="Alice", role=Role.SEER),
-                Player(name="Bob", role=Role.WEREWOLF),
-                Player(name="Charlie", role=Role.VILLAGER),
-                Player(name="Dave", role=Role.VILLAGER),
-                Player(name="Eve", role=Role.VILLAGER),
-            )
-        )
-        providers = _create_all_random_providers(game, rng)
-        engine = GameEngine(game=game, providers=providers, rng=rng)
-        return engine, game
+        return _create_engine(_FIVE_PLAYER_GAME, seed), _FIVE_PLAYER_GAME
 
     def test_discussion_logs_created_day1(self) -> None:
         engine, _ = self._setup_game()
         result = engine._day_phase()  # noqa: SLF001
 
         # Day 1 は 2巡 = 5人 × 2 = 10人分の発言
-        discussion_logs = [log for log in result.log if "[発言]" in log]
+        discussion_logs = [log for log in result.log if log.startswith("[発言]")]
         assert len(discussion_logs) == 10
 
     def test_discussion_logs_created_day2(self) -> None:
@@ -86,14 +101,14 @@ class TestDayPhase:
         result = engine._day_phase()  # noqa: SLF001
 
         # Day 2 は 2巡 = 10人分の発言
-        discussion_logs = [log for log in result.log if "[発言]" in log]
+        discussion_logs = [log for log in result.log if log.startswith("[発言]")]
         assert len(discussion_logs) == 10
 
     def test_vote_logs_created(self) -> None:
         engine, _ = self._setup_game()
         result = engine._day_phase()  # noqa: SLF001
 
-        vote_logs = [log for log in result.log if "[投票]" in log]
+        vote_logs = [log for log in result.log if log.startswith("[投票]")]
         assert len(vote_logs) == 5
 
     def test_vote_logs_are_grouped_after_all_votes(self) -> None:
@@ -101,7 +116,7 @@ class TestDayPhase:
         engine, _ = self._setup_game()
         result = engine._day_phase()  # noqa: SLF001
 
-        vote_indices = [i for i, log in enumerate(result.log) if "[投票]" in log]
+        vote_indices = [i for i, log in enumerate(result.log) if log.startswith("[投票]")]
         assert len(vote_indices) >= 2
         # 投票ログが連続していることを確認（間に他のログが挟まらない）
         for i in range(len(vote_indices) - 1):
@@ -111,7 +126,7 @@ class TestDayPhase:
         engine, _ = self._setup_game()
         result = engine._day_phase()  # noqa: SLF001
 
-        execution_logs = [log for log in result.log if "[処刑]" in log]
+        execution_logs = [log for log in result.log if log.startswith("[処刑]")]
         assert len(execution_logs) == 1
 
 
@@ -119,41 +134,17 @@ class TestNightPhase:
     """夜フェーズの個別テスト。"""
 
     def test_attack_kills_player(self) -> None:
-        rng = random.Random(42)
-        game = GameState(
-            players=(
-                Player(name="Alice", role=Role.SEER),
-                Player(name="Bob", role=Role.WEREWOLF),
-                Player(name="Charlie", role=Role.VILLAGER),
-                Player(name="Dave", role=Role.VILLAGER),
-                Player(name="Eve", role=Role.VILLAGER),
-            )
-        )
-        providers = _create_all_random_providers(game, rng)
-        engine = GameEngine(game=game, providers=providers, rng=rng)
-        engine._game = game  # noqa: SLF001
+        engine = _create_engine(_FIVE_PLAYER_GAME)
 
         result = engine._night_phase()  # noqa: SLF001
 
-        attack_logs = [log for log in result.log if "[襲撃]" in log]
+        attack_logs = [log for log in result.log if log.startswith("[襲撃]")]
         assert len(attack_logs) == 1
         dead_count = sum(1 for p in result.players if p.status == PlayerStatus.DEAD)
         assert dead_count == 1
 
     def test_divine_recorded_when_seer_survives(self) -> None:
-        rng = random.Random(100)
-        game = GameState(
-            players=(
-                Player(name="Alice", role=Role.SEER),
-                Player(name="Bob", role=Role.WEREWOLF),
-                Player(name="Charlie", role=Role.VILLAGER),
-                Player(name="Dave", role=Role.VILLAGER),
-                Player(name="Eve", role=Role.VILLAGER),
-            )
-        )
-        providers = _create_all_random_providers(game, rng)
-        engine = GameEngine(game=game, providers=providers, rng=rng)
-        engine._game = game  # noqa: SLF001
+        engine = _create_engine(_FIVE_PLAYER_GAME, 100)
 
         result = engine._night_phase()  # noqa: SLF001
 
@@ -166,19 +157,7 @@ class TestNightPhase:
             assert len(result.divined_history) == 0
 
     def test_night_transitions_to_next_day(self) -> None:
-        rng = random.Random(42)
-        game = GameState(
-            players=(
-                Player(name="Alice", role=Role.SEER),
-                Player(name="Bob", role=Role.WEREWOLF),
-                Player(name="Charlie", role=Role.VILLAGER),
-                Player(name="Dave", role=Role.VILLAGER),
-                Player(name="Eve", role=Role.VILLAGER),
-            )
-        )
-        providers = _create_all_random_providers(game, rng)
-        engine = GameEngine(game=game, providers=providers, rng=rng)
-        engine._game = game  # noqa: SLF001
+        engine = _create_engine(_FIVE_PLAYER_GAME)
 
         result = engine._night_phase()  # noqa: SLF001
 
@@ -193,20 +172,9 @@ class TestVoteTie:
         """同一 seed で同票時の結果が決定的であることを確認する。"""
         results = []
         for _ in range(2):
-            rng = random.Random(42)
-            game = GameState(
-                players=(
-                    Player(name="Alice", role=Role.SEER),
-                    Player(name="Bob", role=Role.WEREWOLF),
-                    Player(name="Charlie", role=Role.VILLAGER),
-                    Player(name="Dave", role=Role.VILLAGER),
-                    Player(name="Eve", role=Role.VILLAGER),
-                )
-            )
-            providers = _create_all_random_providers(game, rng)
-            engine = GameEngine(game=game, providers=providers, rng=rng)
+            engine = _create_engine(_FIVE_PLAYER_GAME)
             result = engine._day_phase()  # noqa: SLF001
-            execution_log = [log for log in result.log if "[処刑]" in log]
+            execution_log = [log for log in result.log if log.startswith("[処刑]")]
             results.append(execution_log)
 
         assert results[0] == results[1]
@@ -216,45 +184,22 @@ class TestDivineResultNotification:
     """占い結果通知テスト。"""
 
     def test_divine_result_notified_on_day2(self) -> None:
-        rng = random.Random(42)
-        game = GameState(
-            players=(
-                Player(name="Alice", role=Role.SEER),
-                Player(name="Bob", role=Role.WEREWOLF),
-                Player(name="Charlie", role=Role.VILLAGER),
-                Player(name="Dave", role=Role.VILLAGER),
-                Player(name="Eve", role=Role.VILLAGER),
-            ),
-            day=2,
-            divined_history=(("Alice", "Charlie"),),
-        )
-        providers = _create_all_random_providers(game, rng)
-        engine = GameEngine(game=game, providers=providers, rng=rng)
+        game = replace(_FIVE_PLAYER_GAME, day=2, divined_history=(("Alice", "Charlie"),))
+        engine = _create_engine(game)
 
         result = engine._day_phase()  # noqa: SLF001
 
-        divine_result_logs = [log for log in result.log if "[占い結果]" in log]
+        divine_result_logs = [log for log in result.log if log.startswith("[占い結果]")]
         assert len(divine_result_logs) == 1
         assert "Charlie" in divine_result_logs[0]
         assert "人狼ではない" in divine_result_logs[0]
 
     def test_no_divine_result_on_day1(self) -> None:
-        rng = random.Random(42)
-        game = GameState(
-            players=(
-                Player(name="Alice", role=Role.SEER),
-                Player(name="Bob", role=Role.WEREWOLF),
-                Player(name="Charlie", role=Role.VILLAGER),
-                Player(name="Dave", role=Role.VILLAGER),
-                Player(name="Eve", role=Role.VILLAGER),
-            ),
-        )
-        providers = _create_all_random_providers(game, rng)
-        engine = GameEngine(game=game, providers=providers, rng=rng)
+        engine = _create_engine(_FIVE_PLAYER_GAME)
 
         result = engine._day_phase()  # noqa: SLF001
 
-        divine_result_logs = [log for log in result.log if "[占い結果]" in log]
+        divine_result_logs = [log for log in result.log if log.startswith("[占い結果]")]
         assert len(divine_result_logs) == 0
 
 
@@ -262,18 +207,7 @@ class TestSpeakingOrder:
     """発言順のテスト。"""
 
     def _setup_engine(self, seed: int = 42) -> GameEngine:
-        rng = random.Random(seed)
-        game = GameState(
-            players=(
-                Player(name="Alice", role=Role.SEER),
-                Player(name="Bob", role=Role.WEREWOLF),
-                Player(name="Charlie", role=Role.VILLAGER),
-                Player(name="Dave", role=Role.VILLAGER),
-                Player(name="Eve", role=Role.VILLAGER),
-            )
-        )
-        providers = _create_all_random_providers(game, rng)
-        return GameEngine(game=game, providers=providers, rng=rng)
+        return _create_engine(_FIVE_PLAYER_GAME, seed)
 
     def _extract_speaker_order(self, game: GameState, round_num: int = 1) -> list[str]:
         """ログから指定ラウンドの発言順を抽出する。"""
@@ -281,14 +215,12 @@ class TestSpeakingOrder:
         speakers: list[str] = []
         current_round = 0
         for log in game.log:
-            if "[議論] ラウンド" in log:
+            if log.startswith("[議論] ラウンド"):
                 current_round += 1
                 in_round = current_round == round_num
                 continue
-            if in_round and "[発言]" in log:
-                # "[発言] Alice: ..." → "Alice"
-                name = log.split("[発言] ")[1].split(":")[0]
-                speakers.append(name)
+            if in_round and (match := _STATEMENT_SPEAKER_RE.match(log)):
+                speakers.append(match.group(1))
         return speakers
 
     def test_day1_discussion_follows_speaking_order(self) -> None:
@@ -314,12 +246,14 @@ class TestSpeakingOrder:
 
         new_order = engine._speaking_order  # noqa: SLF001
         # 襲撃があれば発言順が変わっているはず
-        attack_logs = [log for log in engine._game.log if "[襲撃]" in log]  # noqa: SLF001
-        if attack_logs:
+        attack_match = next(
+            (m for log in engine._game.log if (m := _ATTACKED_NAME_RE.match(log))),  # noqa: SLF001
+            None,
+        )
+        if attack_match:
             assert new_order != original_order
             # 襲撃された人は新しい発言順に含まれない
-            attacked_name = attack_logs[0].split("[襲撃] ")[1].split(" が")[0]
-            assert attacked_name not in new_order
+            assert attack_match.group(1) not in new_order
 
     def test_speaking_order_maintained_across_rounds(self) -> None:
         """Day 2 の 2 ラウンドで発言順が同じことを確認する。"""
@@ -391,7 +325,7 @@ class TestGuardNightPhase:
         result = engine._night_phase()  # noqa: SLF001
 
         # 護衛成功ログがある
-        assert any("[護衛成功]" in log for log in result.log)
+        assert any(log.startswith("[護衛成功]") for log in result.log)
         # 「今夜は誰も襲撃されなかった」ログがある
         assert any("今夜は誰も襲撃されなかった" in log for log in result.log)
         # Alice は生存
@@ -404,7 +338,7 @@ class TestGuardNightPhase:
         result = engine._night_phase()  # noqa: SLF001
 
         # 護衛成功ログがない
-        assert not any("[護衛成功]" in log for log in result.log)
+        assert not any(log.startswith("[護衛成功]") for log in result.log)
         # Alice が襲撃された
         assert any("Alice が人狼に襲撃された" in log for log in result.log)
         alice = result.find_player("Alice")
@@ -469,7 +403,7 @@ class TestMediumResult:
 
         result = engine._day_phase()  # noqa: SLF001
 
-        medium_logs = [log for log in result.log if "[霊媒結果]" in log]
+        medium_logs = [log for log in result.log if log.startswith("[霊媒結果]")]
         assert len(medium_logs) == 1
         assert "Bob" in medium_logs[0]
         assert "人狼" in medium_logs[0]
@@ -491,7 +425,7 @@ class TestMediumResult:
 
         result = engine._day_phase()  # noqa: SLF001
 
-        medium_logs = [log for log in result.log if "[霊媒結果]" in log]
+        medium_logs = [log for log in result.log if log.startswith("[霊媒結果]")]
         assert len(medium_logs) == 0
 
 
@@ -549,17 +483,17 @@ class TestOnPhaseEndCallback:
 class TestNinePlayerFullSimulation:
     """9人でのゲーム完走テスト。"""
 
-    def test_nine_player_game_completes(self) -> None:
+    @pytest.mark.parametrize("seed", [42, 100, 200, 500, 999])
+    def test_nine_player_game_completes(self, seed: int) -> None:
         """9人村（人狼2, 狩人1, 占い師1, 霊媒師1, 狂人1, 村人3）でゲームが完走する。"""
-        for seed in [42, 100, 200, 500, 999]:
-            rng = random.Random(seed)
-            game = create_game(["Alice", "Bob", "Charlie", "Dave", "Eve", "Frank", "Grace", "Heidi", "Ivan"], rng=rng)
-            providers = _create_all_random_providers(game, rng)
-            engine = GameEngine(game=game, providers=providers, rng=rng)
+        rng = random.Random(seed)
+        game = create_game(["Alice", "Bob", "Charlie", "Dave", "Eve", "Frank", "Grace", "Heidi", "Ivan"], rng=rng)
+        providers = _create_all_random_providers(game, rng)
+        engine = GameEngine(game=game, providers=providers, rng=rng)
 
-            result = engine.run()
+        result = engine.run()
 
-            assert any("ゲーム終了" in log for log in result.log)
+        assert any("ゲーム終了" in log for log in result.log)
 
     def test_nine_player_game_has_guard_and_medium(self) -> None:
         """9人村で護衛と霊媒が実際に機能する。"""
@@ -571,7 +505,7 @@ class TestNinePlayerFullSimulation:
         result = engine.run()
 
         # 護衛ログが存在する
-        guard_logs = [log for log in result.log if "[護衛]" in log]
+        guard_logs = [log for log in result.log if log.startswith("[護衛]")]
         assert len(guard_logs) > 0
 
         # 霊媒結果が記録されている（少なくとも1回は処刑が発生するはず）
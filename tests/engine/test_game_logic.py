@@ -2,13 +2,16 @@ import random
 
 from llm_werewolf.domain.game import GameState
 from llm_werewolf.domain.player import Player
-from llm_werewolf.domain.value_objects import NightActionType, Role
+from llm_werewolf.domain.value_objects import NightActionType, Role, Team
 from llm_werewolf.engine.game_logic import (
+    count_votes_for,
     execute_attack,
     execute_divine,
     execute_guard,
     execute_initial_divine,
     find_night_actor,
+    format_divine_result,
+    format_game_over,
     get_alive_speaking_order,
     get_attack_candidates,
     get_discussion_rounds,
@@ -53,6 +56,12 @@ class TestGetAliveSpeakingOrder:
         result = get_alive_speaking_order(game, order)
         assert "Bob" not in [p.name for p in result]
 
+    def test_skips_unknown_names(self) -> None:
+        game = _make_game()
+        order = ("Charlie", "Unknown", "Alice")
+        result = get_alive_speaking_order(game, order)
+        assert [p.name for p in result] == ["Charlie", "Alice"]
+
     def test_empty_order_returns_alive_players(self) -> None:
         game = _make_game()
         result = get_alive_speaking_order(game, ())
@@ -131,6 +140,14 @@ class TestNotifyDivineResult:
         assert len(divine_logs) == 1
         assert "人狼ではない" in divine_logs[0]
 
+    def test_pending_log_matches_history_derived_log(self) -> None:
+        """前夜に確定した通知文は、履歴から導出した通知文と同一になる。"""
+        game = GameState(players=_make_game().players, day=2, divined_history=(("Alice", "Bob"),))
+        from_history = notify_divine_result(game)
+        from_pending = notify_divine_result(game, format_divine_result("Alice", "Bob", True))
+        assert from_pending.log == from_history.log
+        assert from_pending.log[-1] == "[占い結果] Alice の占い: Bob は 人狼"
+
     def test_no_notification_on_day1(self) -> None:
         game = _make_game()
         result = notify_divine_result(game)
@@ -391,6 +408,19 @@ class TestTallyVotes:
         assert result in ("Bob", "Dave", "Alice")
 
 
+class TestFormatGameOver:
+    def test_labels_each_team(self) -> None:
+        assert format_game_over(Team.VILLAGE) == "=== ゲーム終了: 村人陣営の勝利 ==="
+        assert format_game_over(Team.WEREWOLF) == "=== ゲーム終了: 人狼陣営の勝利 ==="
+
+
+class TestCountVotesFor:
+    def test_counts_votes_for_target(self) -> None:
+        votes = {"Alice": "Bob", "Charlie": "Bob", "Eve": "Alice"}
+        assert count_votes_for(votes, "Bob") == 2
+        assert count_votes_for(votes, "Dave") == 0
+
+
 class TestRotateSpeakingOrder:
     def test_rotates_after_removal(self) -> None:
         order = ("Alice", "Bob", "Charlie", "Dave", "Eve")
@@ -97,6 +97,26 @@ class TestHandleUserDiscuss:
         msgs, _ = engine.handle_user_discuss("怪しいのは誰だ")
         assert any("[発言] Alice: 怪しいのは誰だ" in log for log in engine.game.log)
 
+    def test_reuses_discussion_order_from_advance(self) -> None:
+        engine = _create_engine(human_name="Alice")
+        engine.advance_discussion()
+        order = engine.discussion_order
+        human_idx = engine.human_order_index
+        assert human_idx is not None
+        assert order[human_idx] == "Alice"
+
+        msgs, _ = engine.handle_user_discuss("テスト発言")
+        after_names = [m.split(":", 1)[0] for m in msgs[1 : len(order) - human_idx]]
+        assert after_names == list(order[human_idx + 1 :])
+
+    def test_discussion_order_cleared_after_use(self) -> None:
+        engine = _create_engine(human_name="Alice")
+        engine.advance_discussion()
+        engine.handle_user_discuss("ラウンド1")
+        engine.handle_user_discuss("ラウンド2")
+        assert engine.discussion_order == ()
+        assert engine.human_order_index is None
+
     def test_day2_first_round_not_vote_ready(self) -> None:
         """Day 2 ではラウンド1の後に vote_ready=False が返る。"""
         for seed in range(50):
@@ -374,6 +394,18 @@ class TestGetNightActionCandidates:
         assert engine.get_night_action_candidates() == []
 
 
+class TestGetNightAction:
+    def test_matches_type_and_candidates(self) -> None:
+        engine = _create_engine(role=Role.KNIGHT)
+        action_type, candidates = engine.get_night_action()
+        assert action_type == engine.get_night_action_type() == NightActionType.GUARD
+        assert candidates == engine.get_night_action_candidates()
+
+    def test_villager_returns_none_and_empty(self) -> None:
+        engine = _create_engine(role=Role.VILLAGER)
+        assert engine.get_night_action() == (None, [])
+
+
 class TestFullGame:
     def test_complete_game_reaches_winner(self) -> None:
         """エンジンを通してゲーム全体をプレイし、勝者が決まる。"""
@@ -53,6 +53,12 @@ class TestInteractiveSessionStore:
         session = _create_session()
         assert "=== ゲーム開始 ===" in session.game.log
 
+    def test_session_uses_slots(self) -> None:
+        session = _create_session()
+        assert not hasattr(session, "__dict__")
+        with pytest.raises(AttributeError):
+            session.unknown_field = 1  # type: ignore[attr-defined]
+
     def test_get_returns_none_for_unknown_id(self) -> None:
         store = InteractiveSessionStore()
         assert store.get("unknown") is None
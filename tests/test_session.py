@@ -1,4 +1,5 @@
 import random
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -91,6 +92,87 @@ class TestGameSessionStore:
         game_id, _ = store.create(PLAYER_NAMES, rng=random.Random(2))
         assert game_id is not None
 
+    def test_concurrent_create_respects_max_sessions(self) -> None:
+        store = GameSessionStore(max_sessions=4)
+
+        def create(seed: int) -> str | None:
+            try:
+                game_id, _ = store.create(PLAYER_NAMES, rng=random.Random(seed))
+            except SessionLimitExceeded:
+                return None
+            return game_id
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(create, range(8)))
+
+        created = [game_id for game_id in results if game_id is not None]
+        assert len(created) == 4
+        assert len(set(created)) == 4
+        assert len(store.list_sessions()) == 4
+
+    def test_expired_session_is_evicted(self) -> None:
+        now = [0.0]
+        store = GameSessionStore(ttl_seconds=60, clock=lambda: now[0])
+        game_id, _ = store.create(PLAYER_NAMES, rng=random.Random(42))
+        now[0] = 59.0
+        assert store.get(game_id) is not None
+        now[0] = 200.0
+        assert store.get(game_id) is None
+        assert store.list_sessions() == {}
+
+    def test_get_refreshes_last_access(self) -> None:
+        now = [0.0]
+        store = GameSessionStore(ttl_seconds=60, clock=lambda: now[0])
+        old_id, _ = store.create(PLAYER_NAMES, rng=random.Random(0))
+        now[0] = 30.0
+        new_id, _ = store.create(PLAYER_NAMES, rng=random.Random(1))
+        now[0] = 50.0
+        store.get(old_id)
+        # new_id は最終アクセスから 60 秒超、old_id は get で延命されている
+        now[0] = 100.0
+        assert set(store.list_sessions()) == {old_id}
+        assert store.get(new_id) is None
+
+    def test_expired_sessions_free_capacity(self) -> None:
+        now = [0.0]
+        store = GameSessionStore(max_sessions=1, ttl_seconds=60, clock=lambda: now[0])
+        store.create(PLAYER_NAMES, rng=random.Random(0))
+        now[0] = 61.0
+        game_id, _ = store.create(PLAYER_NAMES, rng=random.Random(1))
+        assert list(store.list_sessions()) == [game_id]
+
+    def test_full_store_evicts_least_recent_idle_session(self) -> None:
+        now = [0.0]
+        store = GameSessionStore(max_sessions=2, ttl_seconds=None, idle_eviction_seconds=60, clock=lambda: now[0])
+        old_id, _ = store.create(PLAYER_NAMES, rng=random.Random(0))
+        now[0] = 50.0
+        kept_id, _ = store.create(PLAYER_NAMES, rng=random.Random(1))
+        now[0] = 70.0
+        new_id, _ = store.create(PLAYER_NAMES, rng=random.Random(2))
+        assert set(store.list_sessions()) == {kept_id, new_id}
+        assert store.get(old_id) is None
+
+    def test_get_protects_session_from_idle_eviction_without_ttl(self) -> None:
+        now = [0.0]
+        store = GameSessionStore(max_sessions=2, ttl_seconds=None, idle_eviction_seconds=60, clock=lambda: now[0])
+        used_id, _ = store.create(PLAYER_NAMES, rng=random.Random(0))
+        idle_id, _ = store.create(PLAYER_NAMES, rng=random.Random(1))
+        for t in range(10, 80, 10):
+            now[0] = float(t)
+            assert store.get(used_id) is not None
+        new_id, _ = store.create(PLAYER_NAMES, rng=random.Random(2))
+        assert set(store.list_sessions()) == {used_id, new_id}
+        assert store.get(idle_id) is None
+
+    def test_full_store_raises_when_all_sessions_recently_used(self) -> None:
+        now = [0.0]
+        store = GameSessionStore(max_sessions=2, ttl_seconds=None, idle_eviction_seconds=60, clock=lambda: now[0])
+        store.create(PLAYER_NAMES, rng=random.Random(0))
+        store.create(PLAYER_NAMES, rng=random.Random(1))
+        now[0] = 30.0
+        with pytest.raises(SessionLimitExceeded):
+            store.create(PLAYER_NAMES, rng=random.Random(2))
+
 
 def _create_test_config() -> LLMConfig:
     return LLMConfig(model_name="gpt-4o-mini", temperature=0.7, api_key="test-key")